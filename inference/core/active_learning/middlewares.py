@@ -3,6 +3,8 @@ from queue import Queue
 from threading import Thread
 from typing import Any, List, Optional
 
+import cv2
+
 from inference.core import logger
 from inference.core.active_learning.accounting import image_can_be_submitted_to_batch
 from inference.core.active_learning.batching import generate_batch_name
@@ -157,7 +159,7 @@ class ActiveLearningMiddleware:
             disable_preproc_auto_orient=disable_preproc_auto_orient,
         )
         if not is_bgr:
-            image = image[:, :, ::-1]
+            image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
         matching_strategies = execute_sampling(
             image=image,
             prediction=prediction,
@@ -0,0 +1,46 @@
+import threading
+from enum import Enum
+from typing import Dict, Union
+
+
+class RegistrationOutcome(Enum):
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+class RegistrationStatistics:
+    """
+    Thread-safe counters of datapoints registrations executed in the background,
+    where both outcome and errors are not visible to the caller that scheduled them.
+    Registrations rejected due to usage limits or duplicates are counted as skipped.
+    """
+
+    def __init__(self):
+        self._outcomes = {outcome: 0 for outcome in RegistrationOutcome}
+        self._total_duration = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, outcome: RegistrationOutcome, duration: float) -> None:
+        with self._lock:
+            self._outcomes[outcome] += 1
+            self._total_duration += duration
+
+    def snapshot(self) -> Dict[str, Union[int, float]]:
+        with self._lock:
+            result = {outcome.value: count for outcome, count in self._outcomes.items()}
+            result["total_duration"] = self._total_duration
+            return result
+
+
+_BACKGROUND_REGISTRATION_STATISTICS = RegistrationStatistics()
+
+
+def record_background_registration(
+    outcome: RegistrationOutcome, duration: float
+) -> None:
+    _BACKGROUND_REGISTRATION_STATISTICS.record(outcome=outcome, duration=duration)
+
+
+def get_background_registration_statistics() -> Dict[str, Union[int, float]]:
+    return _BACKGROUND_REGISTRATION_STATISTICS.snapshot()
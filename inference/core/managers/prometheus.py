@@ -6,6 +6,9 @@ from prometheus_client.core import REGISTRY, CounterMetricFamily, GaugeMetricFam
 from prometheus_client.registry import Collector
 from prometheus_fastapi_instrumentator import Instrumentator
 
+from inference.core.active_learning.registration_statistics import (
+    get_background_registration_statistics,
+)
 from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
 from inference.core.logger import logger
 from inference.core.managers.metrics import get_model_metrics
@@ -100,3 +103,24 @@ class CustomCollector(Collector):
             f"Total number of errors in {self.time_window}s",
             value=num_errors_total,
         )
+        registration_statistics = get_background_registration_statistics()
+        yield CounterMetricFamily(
+            "workflows_background_registrations_succeeded",
+            "Number of datapoints registered at Roboflow in background tasks",
+            value=registration_statistics["succeeded"],
+        )
+        yield CounterMetricFamily(
+            "workflows_background_registrations_failed",
+            "Number of failed datapoints registrations at Roboflow in background tasks",
+            value=registration_statistics["failed"],
+        )
+        yield CounterMetricFamily(
+            "workflows_background_registrations_skipped",
+            "Number of skipped (usage limits exceeded or duplicated) datapoints registrations at Roboflow in background tasks",
+            value=registration_statistics["skipped"],
+        )
+        yield CounterMetricFamily(
+            "workflows_background_registrations_duration_seconds",
+            "Total time spent registering datapoints at Roboflow in background tasks",
+            value=registration_statistics["total_duration"],
+        )
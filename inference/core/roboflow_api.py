@@ -1,8 +1,10 @@
 import hashlib
 import json
 import os
+import threading
 import urllib.parse
 from enum import Enum
+from http.cookiejar import DefaultCookiePolicy
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import requests
@@ -56,6 +58,20 @@ NOT_FOUND_ERROR_MESSAGE = (
     "version are correct, and check that the provided Roboflow API key has the correct permissions."
 )
 
+# Per-thread sessions let consecutive datapoints registrations re-use keep-alive
+# connections instead of paying for TCP / TLS handshake on each request
+_ROBOFLOW_UPLOAD_SESSIONS = threading.local()
+
+
+def _get_roboflow_upload_session() -> requests.Session:
+    session = getattr(_ROBOFLOW_UPLOAD_SESSIONS, "session", None)
+    if session is None:
+        session = requests.Session()
+        # requests are authorised with API key - cookies must not leak between callers
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _ROBOFLOW_UPLOAD_SESSIONS.session = session
+    return session
+
 
 def raise_from_lambda(
     inner_error: Exception, exception_type: Type[Exception], message: str
@@ -317,7 +333,7 @@ def register_image_at_roboflow(
             "file": ("imageToUpload", image_bytes, "image/jpeg"),
         }
     )
-    response = requests.post(
+    response = _get_roboflow_upload_session().post(
         url=wrapped_url,
         data=m,
         headers={"Content-Type": m.content_type},
@@ -356,7 +372,7 @@ def annotate_image_at_roboflow(
         ("prediction", str(is_prediction).lower()),
     ]
     wrapped_url = wrap_url(_add_params_to_url(url=url, params=params))
-    response = requests.post(
+    response = _get_roboflow_upload_session().post(
         wrapped_url,
         data=annotation_content,
         headers={"Content-Type": "text/plain"},
@@ -124,6 +124,19 @@ class ImageThresholdBlockV1(WorkflowBlock):
         return {OUTPUT_IMAGE_KEY: output}
 
 
+FIXED_THRESHOLD_TYPES = {
+    "binary": cv2.THRESH_BINARY,
+    "binary_inv": cv2.THRESH_BINARY_INV,
+    "trunc": cv2.THRESH_TRUNC,
+    "tozero": cv2.THRESH_TOZERO,
+    "tozero_inv": cv2.THRESH_TOZERO_INV,
+}
+ADAPTIVE_THRESHOLD_METHODS = {
+    "adaptive_mean": cv2.ADAPTIVE_THRESH_MEAN_C,
+    "adaptive_gaussian": cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+}
+
+
 def apply_thresholding(
     image: np.ndarray, threshold_type: str, thresh_value: int, max_value: int
 ) -> np.ndarray:
@@ -139,35 +152,15 @@ def apply_thresholding(
     Returns:
         np.ndarray: Image with thresholding applied.
     """
-    if threshold_type == "binary":
-        _, thresh_image = cv2.threshold(
-            image, thresh_value, max_value, cv2.THRESH_BINARY
-        )
-    elif threshold_type == "binary_inv":
-        _, thresh_image = cv2.threshold(
-            image, thresh_value, max_value, cv2.THRESH_BINARY_INV
-        )
-    elif threshold_type == "trunc":
+    if threshold_type in FIXED_THRESHOLD_TYPES:
         _, thresh_image = cv2.threshold(
-            image, thresh_value, max_value, cv2.THRESH_TRUNC
-        )
-    elif threshold_type == "tozero":
-        _, thresh_image = cv2.threshold(
-            image, thresh_value, max_value, cv2.THRESH_TOZERO
-        )
-    elif threshold_type == "tozero_inv":
-        _, thresh_image = cv2.threshold(
-            image, thresh_value, max_value, cv2.THRESH_TOZERO_INV
-        )
-    elif threshold_type == "adaptive_mean":
-        thresh_image = cv2.adaptiveThreshold(
-            image, max_value, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, 11, 2
+            image, thresh_value, max_value, FIXED_THRESHOLD_TYPES[threshold_type]
         )
-    elif threshold_type == "adaptive_gaussian":
+    elif threshold_type in ADAPTIVE_THRESHOLD_METHODS:
         thresh_image = cv2.adaptiveThreshold(
             image,
             max_value,
-            cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+            ADAPTIVE_THRESHOLD_METHODS[threshold_type],
             cv2.THRESH_BINARY,
             11,
             2,
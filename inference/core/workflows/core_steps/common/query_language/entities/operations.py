@@ -966,3 +966,18 @@ class StatementGroup(BaseModel):
         ]
     ] = Field(min_items=1)
     operator: StatementsGroupsOperator = StatementsGroupsOperator.OR
+
+
+# Models referring to `StatementGroup` / `AllOperationsType` before they are defined
+# would otherwise be built lazily on first validation
+for _model in (
+    DetectionsFilter,
+    SequenceApply,
+    OperationsChain,
+    StaticOperand,
+    DynamicOperand,
+    BinaryStatement,
+    UnaryStatement,
+):
+    _model.model_rebuild()
+del _model
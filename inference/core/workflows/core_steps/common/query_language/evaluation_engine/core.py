@@ -281,8 +281,8 @@ def unary_eval(
 
 
 COMPOUND_EVAL_STATEMENTS_COMBINERS = {
-    StatementsGroupsOperator.AND: lambda a, b: a and b,
-    StatementsGroupsOperator.OR: lambda a, b: a or b,
+    StatementsGroupsOperator.AND: all,
+    StatementsGroupsOperator.OR: any,
 }
 
 
@@ -305,8 +305,5 @@ def compound_eval(
             context=f"step_execution | roboflow_query_language_evaluation | {execution_context}",
         )
     operator_fun = COMPOUND_EVAL_STATEMENTS_COMBINERS[operator]
-    result = statements_functions[0](values)
-    for fun in statements_functions[1:]:
-        fun_result = fun(values)
-        result = operator_fun(result, fun_result)
-    return result
+    # short-circuits - statements after the one deciding on result are not evaluated
+    return operator_fun(fun(values) for fun in statements_functions)
@@ -3,9 +3,9 @@ import logging
 import os.path
 from datetime import datetime
 from io import TextIOWrapper
-from typing import Any, List, Literal, Optional, Type, Union
+from typing import List, Literal, Optional, Type, Union
 
-from pydantic import ConfigDict, Field, field_validator
+from pydantic import ConfigDict, Field, PositiveInt
 
 from inference.core.workflows.execution_engine.entities.base import OutputDefinition
 from inference.core.workflows.execution_engine.entities.types import (
@@ -114,29 +114,22 @@ class BlockManifest(WorkflowBlockManifest):
             "always_visible": True,
         },
     )
-    max_entries_per_file: Union[int, WorkflowParameterSelector(kind=[STRING_KIND])] = (
-        Field(
-            default=1024,
-            description="Defines how many datapoints can be appended to a single file",
-            examples=[1024],
-            json_schema_extra={
-                "relevant_for": {
-                    "output_mode": {
-                        "values": ["append_log"],
-                        "required": True,
-                    },
-                }
-            },
-        )
+    max_entries_per_file: Union[
+        PositiveInt, WorkflowParameterSelector(kind=[STRING_KIND])
+    ] = Field(
+        default=1024,
+        description="Defines how many datapoints can be appended to a single file",
+        examples=[1024],
+        json_schema_extra={
+            "relevant_for": {
+                "output_mode": {
+                    "values": ["append_log"],
+                    "required": True,
+                },
+            }
+        },
     )
 
-    @field_validator("max_entries_per_file")
-    @classmethod
-    def ensure_max_entries_per_file_is_correct(cls, value: Any) -> Any:
-        if isinstance(value, int) and value < 1:
-            raise ValueError("`max_entries_per_file` cannot be lower than 1.")
-        return value
-
     @classmethod
     def describe_outputs(cls) -> List[OutputDefinition]:
         return [
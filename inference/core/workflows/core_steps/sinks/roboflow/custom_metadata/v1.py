@@ -171,7 +171,7 @@ def get_workspace_name(
     api_key: str,
     cache: BaseCache,
 ) -> str:
-    api_key_hash = hashlib.md5(api_key.encode("utf-8")).hexdigest()
+    api_key_hash = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
     cache_key = f"workflows:api_key_to_workspace:{api_key_hash}"
     cached_workspace_name = cache.get(cache_key)
     if cached_workspace_name:
@@ -18,10 +18,13 @@ code.
 import hashlib
 import json
 import logging
+import threading
+import time
 from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import partial
+from itertools import repeat
 from typing import List, Literal, Optional, Tuple, Type, Union
 from uuid import uuid4
 
@@ -39,7 +42,12 @@ from inference.core.active_learning.entities import (
     StrategyLimit,
     StrategyLimitType,
 )
+from inference.core.active_learning.registration_statistics import (
+    RegistrationOutcome,
+    record_background_registration,
+)
 from inference.core.cache.base import BaseCache
+from inference.core.env import WORKFLOWS_DATASET_UPLOAD_MAX_CONCURRENT_REQUESTS
 from inference.core.roboflow_api import (
     annotate_image_at_roboflow,
     get_roboflow_workspace,
@@ -48,7 +56,10 @@ from inference.core.roboflow_api import (
 from inference.core.workflows.core_steps.common.serializers import (
     serialise_sv_detections,
 )
-from inference.core.workflows.core_steps.common.utils import scale_sv_detections
+from inference.core.workflows.core_steps.common.utils import (
+    run_in_parallel,
+    scale_sv_detections,
+)
 from inference.core.workflows.execution_engine.constants import INFERENCE_ID_KEY
 from inference.core.workflows.execution_engine.entities.base import (
     Batch,
@@ -87,10 +98,17 @@ collect data that the model struggle with.
 """
 
 WORKSPACE_NAME_CACHE_EXPIRE = 900  # 15 min
+WORKSPACE_NAME_LOCAL_CACHE_SIZE = 256
 TIMESTAMP_FORMAT = "%Y_%m_%d"
 DUPLICATED_STATUS = "Duplicated image"
+USAGE_QUOTA_EXCEEDED_STATUS = "Registration skipped due to usage quota exceeded"
+SKIPPED_REGISTRATION_STATUSES = {DUPLICATED_STATUS, USAGE_QUOTA_EXCEEDED_STATUS}
 BatchCreationFrequency = Literal["never", "daily", "weekly", "monthly"]
 
+# cache_key -> (workspace_name, expiry of the entry in terms of time.monotonic()) - LRU
+_WORKSPACE_NAME_LOCAL_CACHE: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+_WORKSPACE_NAME_LOCAL_CACHE_LOCK = threading.Lock()
+
 
 class BlockManifest(WorkflowBlockManifest):
     model_config = ConfigDict(
@@ -274,78 +292,171 @@ class RoboflowDatasetUploadBlockV1(WorkflowBlock):
                 }
                 for _ in range(len(images))
             ]
-        result = []
-        predictions = [None] * len(images) if predictions is None else predictions
-        for image, prediction in zip(images, predictions):
-            error_status, message = register_datapoint_at_roboflow(
+        predictions = repeat(None) if predictions is None else predictions
+        matching_strategies_limits = build_matching_strategies_limits(
+            usage_quota_name=usage_quota_name,
+            minutely_usage_limit=minutely_usage_limit,
+            hourly_usage_limit=hourly_usage_limit,
+            daily_usage_limit=daily_usage_limit,
+        )
+        batch_name = generate_batch_name(
+            labeling_batch_prefix=labeling_batch_prefix,
+            new_labeling_batch_frequency=labeling_batches_recreation_frequency,
+        )
+        # elements scheduled for background registration are staged and handed
+        # over as a single task, as FastAPI runs background tasks sequentially
+        staged_background_tasks = (
+            BackgroundTasks() if fire_and_forget and self._background_tasks else None
+        )
+        registration_tasks = [
+            partial(
+                register_datapoint_at_roboflow,
                 image=image,
                 prediction=prediction,
                 target_project=target_project,
-                usage_quota_name=usage_quota_name,
                 persist_predictions=persist_predictions,
-                minutely_usage_limit=minutely_usage_limit,
-                hourly_usage_limit=hourly_usage_limit,
-                daily_usage_limit=daily_usage_limit,
+                matching_strategies_limits=matching_strategies_limits,
                 max_image_size=max_image_size,
                 compression_level=compression_level,
                 registration_tags=registration_tags,
                 fire_and_forget=fire_and_forget,
-                labeling_batch_prefix=labeling_batch_prefix,
-                new_labeling_batch_frequency=labeling_batches_recreation_frequency,
+                batch_name=batch_name,
                 cache=self._cache,
-                background_tasks=self._background_tasks,
+                background_tasks=staged_background_tasks,
                 thread_pool_executor=self._thread_pool_executor,
                 api_key=self._api_key,
             )
-            result.append({"error_status": error_status, "message": message})
-        return result
+            for image, prediction in zip(images, predictions)
+        ]
+        if fire_and_forget and (self._background_tasks or self._thread_pool_executor):
+            # tasks only hand elements over to the background - no need for threads
+            registration_results = [task() for task in registration_tasks]
+        else:
+            registration_results = run_in_parallel(
+                tasks=registration_tasks,
+                max_workers=WORKFLOWS_DATASET_UPLOAD_MAX_CONCURRENT_REQUESTS,
+            )
+        if staged_background_tasks is not None:
+            schedule_staged_background_tasks(
+                staged_background_tasks=staged_background_tasks,
+                background_tasks=self._background_tasks,
+            )
+        return [
+            {"error_status": error_status, "message": message}
+            for error_status, message in registration_results
+        ]
+
+
+def schedule_staged_background_tasks(
+    staged_background_tasks: BackgroundTasks,
+    background_tasks: BackgroundTasks,
+) -> None:
+    if not staged_background_tasks.tasks:
+        return None
+    tasks = [
+        partial(task.func, *task.args, **task.kwargs)
+        for task in staged_background_tasks.tasks
+    ]
+    background_tasks.add_task(
+        run_in_parallel,
+        tasks=tasks,
+        max_workers=WORKFLOWS_DATASET_UPLOAD_MAX_CONCURRENT_REQUESTS,
+    )
+
+
+def build_matching_strategies_limits(
+    usage_quota_name: str,
+    minutely_usage_limit: int,
+    hourly_usage_limit: int,
+    daily_usage_limit: int,
+) -> "OrderedDict[str, List[StrategyLimit]]":
+    return OrderedDict(
+        {
+            usage_quota_name: [
+                StrategyLimit(
+                    limit_type=StrategyLimitType.MINUTELY, value=minutely_usage_limit
+                ),
+                StrategyLimit(
+                    limit_type=StrategyLimitType.HOURLY, value=hourly_usage_limit
+                ),
+                StrategyLimit(
+                    limit_type=StrategyLimitType.DAILY, value=daily_usage_limit
+                ),
+            ]
+        }
+    )
 
 
 def register_datapoint_at_roboflow(
     image: WorkflowImageData,
     prediction: Optional[Union[sv.Detections, dict]],
     target_project: str,
-    usage_quota_name: str,
     persist_predictions: bool,
-    minutely_usage_limit: int,
-    hourly_usage_limit: int,
-    daily_usage_limit: int,
+    matching_strategies_limits: "OrderedDict[str, List[StrategyLimit]]",
     max_image_size: Tuple[int, int],
     compression_level: int,
     registration_tags: List[str],
     fire_and_forget: bool,
-    labeling_batch_prefix: str,
-    new_labeling_batch_frequency: BatchCreationFrequency,
+    batch_name: str,
     cache: BaseCache,
     background_tasks: Optional[BackgroundTasks],
     thread_pool_executor: Optional[ThreadPoolExecutor],
     api_key: str,
 ) -> Tuple[bool, str]:
+    if not fire_and_forget or not (background_tasks or thread_pool_executor):
+        return execute_registration(
+            image=image,
+            prediction=prediction,
+            target_project=target_project,
+            persist_predictions=persist_predictions,
+            matching_strategies_limits=matching_strategies_limits,
+            max_image_size=max_image_size,
+            compression_level=compression_level,
+            registration_tags=registration_tags,
+            batch_name=batch_name,
+            cache=cache,
+            api_key=api_key,
+        )
     registration_task = partial(
-        execute_registration,
+        execute_registration_in_background,
         image=image,
         prediction=prediction,
         target_project=target_project,
-        usage_quota_name=usage_quota_name,
         persist_predictions=persist_predictions,
-        minutely_usage_limit=minutely_usage_limit,
-        hourly_usage_limit=hourly_usage_limit,
-        daily_usage_limit=daily_usage_limit,
+        matching_strategies_limits=matching_strategies_limits,
         max_image_size=max_image_size,
         compression_level=compression_level,
         registration_tags=registration_tags,
-        labeling_batch_prefix=labeling_batch_prefix,
-        new_labeling_batch_frequency=new_labeling_batch_frequency,
+        batch_name=batch_name,
         cache=cache,
         api_key=api_key,
     )
-    if fire_and_forget and background_tasks:
+    if background_tasks:
         background_tasks.add_task(registration_task)
-        return False, "Element registration happens in the background task"
-    if fire_and_forget and thread_pool_executor:
+    else:
         thread_pool_executor.submit(registration_task)
-        return False, "Element registration happens in the background task"
-    return registration_task()
+    return False, "Element registration happens in the background task"
+
+
+def execute_registration_in_background(**kwargs) -> None:
+    start = time.monotonic()
+    try:
+        error_status, message = execute_registration(**kwargs)
+    except Exception:
+        logging.exception("Background registration of datapoint failed")
+        outcome = RegistrationOutcome.FAILED
+    else:
+        if error_status:
+            logging.warning(f"Background registration of datapoint failed: {message}")
+            outcome = RegistrationOutcome.FAILED
+        elif message in SKIPPED_REGISTRATION_STATUSES:
+            outcome = RegistrationOutcome.SKIPPED
+        else:
+            outcome = RegistrationOutcome.SUCCEEDED
+    record_background_registration(
+        outcome=outcome,
+        duration=time.monotonic() - start,
+    )
 
 
 def execute_registration(
@@ -353,33 +464,14 @@ def execute_registration(
     prediction: Optional[Union[sv.Detections, dict]],
     target_project: str,
     persist_predictions: bool,
-    usage_quota_name: str,
-    minutely_usage_limit: int,
-    hourly_usage_limit: int,
-    daily_usage_limit: int,
+    matching_strategies_limits: "OrderedDict[str, List[StrategyLimit]]",
     max_image_size: Tuple[int, int],
     compression_level: int,
     registration_tags: List[str],
-    labeling_batch_prefix: str,
-    new_labeling_batch_frequency: BatchCreationFrequency,
+    batch_name: str,
     cache: BaseCache,
     api_key: str,
 ) -> Tuple[bool, str]:
-    matching_strategies_limits = OrderedDict(
-        {
-            usage_quota_name: [
-                StrategyLimit(
-                    limit_type=StrategyLimitType.MINUTELY, value=minutely_usage_limit
-                ),
-                StrategyLimit(
-                    limit_type=StrategyLimitType.HOURLY, value=hourly_usage_limit
-                ),
-                StrategyLimit(
-                    limit_type=StrategyLimitType.DAILY, value=daily_usage_limit
-                ),
-            ]
-        }
-    )
     workspace_name = get_workspace_name(api_key=api_key, cache=cache)
     strategy_with_spare_credit = use_credit_of_matching_strategy(
         cache=cache,
@@ -388,10 +480,10 @@ def execute_registration(
         matching_strategies_limits=matching_strategies_limits,
     )
     if strategy_with_spare_credit is None:
-        return False, "Registration skipped due to usage quota exceeded"
+        return False, USAGE_QUOTA_EXCEEDED_STATUS
     credit_to_be_returned = False
     try:
-        local_image_id = str(uuid4())
+        local_image_id = uuid4().hex
         encoded_image, scaling_factor = prepare_image_to_registration(
             image=image.numpy_image,
             desired_size=ImageDimensions(
@@ -399,11 +491,7 @@ def execute_registration(
             ),
             jpeg_compression_level=compression_level,
         )
-        batch_name = generate_batch_name(
-            labeling_batch_prefix=labeling_batch_prefix,
-            new_labeling_batch_frequency=new_labeling_batch_frequency,
-        )
-        if isinstance(prediction, sv.Detections):
+        if isinstance(prediction, sv.Detections) and scaling_factor != 1.0:
             prediction = scale_sv_detections(
                 detections=prediction, scale=scaling_factor
             )
@@ -440,16 +528,28 @@ def get_workspace_name(
     api_key: str,
     cache: BaseCache,
 ) -> str:
-    api_key_hash = hashlib.md5(api_key.encode("utf-8")).hexdigest()
+    api_key_hash = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
     cache_key = f"workflows:api_key_to_workspace:{api_key_hash}"
-    cached_workspace_name = cache.get(cache_key)
-    if cached_workspace_name:
-        return cached_workspace_name
-    workspace_name_from_api = get_roboflow_workspace(api_key=api_key)
-    cache.set(
-        key=cache_key, value=workspace_name_from_api, expire=WORKSPACE_NAME_CACHE_EXPIRE
-    )
-    return workspace_name_from_api
+    with _WORKSPACE_NAME_LOCAL_CACHE_LOCK:
+        local_cache_entry = _WORKSPACE_NAME_LOCAL_CACHE.get(cache_key)
+        if local_cache_entry is not None and local_cache_entry[1] > time.monotonic():
+            _WORKSPACE_NAME_LOCAL_CACHE.move_to_end(cache_key)
+            return local_cache_entry[0]
+    workspace_name = cache.get(cache_key)
+    if not workspace_name:
+        workspace_name = get_roboflow_workspace(api_key=api_key)
+        cache.set(
+            key=cache_key, value=workspace_name, expire=WORKSPACE_NAME_CACHE_EXPIRE
+        )
+    with _WORKSPACE_NAME_LOCAL_CACHE_LOCK:
+        _WORKSPACE_NAME_LOCAL_CACHE[cache_key] = (
+            workspace_name,
+            time.monotonic() + WORKSPACE_NAME_CACHE_EXPIRE,
+        )
+        _WORKSPACE_NAME_LOCAL_CACHE.move_to_end(cache_key)
+        if len(_WORKSPACE_NAME_LOCAL_CACHE) > WORKSPACE_NAME_LOCAL_CACHE_SIZE:
+            _WORKSPACE_NAME_LOCAL_CACHE.popitem(last=False)
+    return workspace_name
 
 
 def generate_batch_name(
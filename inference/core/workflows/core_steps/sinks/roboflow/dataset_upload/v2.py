@@ -1,5 +1,8 @@
 import random
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import repeat
 from typing import List, Literal, Optional, Tuple, Type, Union
 
 import supervision as sv
@@ -7,9 +10,15 @@ from fastapi import BackgroundTasks
 from pydantic import ConfigDict, Field
 from typing_extensions import Annotated
 
+from inference.core.active_learning.entities import StrategyLimit
 from inference.core.cache.base import BaseCache
+from inference.core.env import WORKFLOWS_DATASET_UPLOAD_MAX_CONCURRENT_REQUESTS
+from inference.core.workflows.core_steps.common.utils import run_in_parallel
 from inference.core.workflows.core_steps.sinks.roboflow.dataset_upload.v1 import (
+    build_matching_strategies_limits,
+    generate_batch_name,
     register_datapoint_at_roboflow,
+    schedule_staged_background_tasks,
 )
 from inference.core.workflows.execution_engine.entities.base import (
     Batch,
@@ -249,50 +258,74 @@ class RoboflowDatasetUploadBlockV2(WorkflowBlock):
                 }
                 for _ in range(len(images))
             ]
-        result = []
-        predictions = [None] * len(images) if predictions is None else predictions
-        for image, prediction in zip(images, predictions):
-            error_status, message = maybe_register_datapoint_at_roboflow(
+        predictions = repeat(None) if predictions is None else predictions
+        matching_strategies_limits = build_matching_strategies_limits(
+            usage_quota_name=usage_quota_name,
+            minutely_usage_limit=minutely_usage_limit,
+            hourly_usage_limit=hourly_usage_limit,
+            daily_usage_limit=daily_usage_limit,
+        )
+        batch_name = generate_batch_name(
+            labeling_batch_prefix=labeling_batch_prefix,
+            new_labeling_batch_frequency=labeling_batches_recreation_frequency,
+        )
+        # elements scheduled for background registration are staged and handed
+        # over as a single task, as FastAPI runs background tasks sequentially
+        staged_background_tasks = (
+            BackgroundTasks() if fire_and_forget and self._background_tasks else None
+        )
+        registration_tasks = [
+            partial(
+                maybe_register_datapoint_at_roboflow,
                 image=image,
                 prediction=prediction,
                 target_project=target_project,
-                usage_quota_name=usage_quota_name,
                 data_percentage=data_percentage,
                 persist_predictions=persist_predictions,
-                minutely_usage_limit=minutely_usage_limit,
-                hourly_usage_limit=hourly_usage_limit,
-                daily_usage_limit=daily_usage_limit,
+                matching_strategies_limits=matching_strategies_limits,
                 max_image_size=max_image_size,
                 compression_level=compression_level,
                 registration_tags=registration_tags,
                 fire_and_forget=fire_and_forget,
-                labeling_batch_prefix=labeling_batch_prefix,
-                new_labeling_batch_frequency=labeling_batches_recreation_frequency,
+                batch_name=batch_name,
                 cache=self._cache,
-                background_tasks=self._background_tasks,
+                background_tasks=staged_background_tasks,
                 thread_pool_executor=self._thread_pool_executor,
                 api_key=self._api_key,
             )
-            result.append({"error_status": error_status, "message": message})
-        return result
+            for image, prediction in zip(images, predictions)
+        ]
+        if fire_and_forget and (self._background_tasks or self._thread_pool_executor):
+            # tasks only hand elements over to the background - no need for threads
+            registration_results = [task() for task in registration_tasks]
+        else:
+            registration_results = run_in_parallel(
+                tasks=registration_tasks,
+                max_workers=WORKFLOWS_DATASET_UPLOAD_MAX_CONCURRENT_REQUESTS,
+            )
+        if staged_background_tasks is not None:
+            schedule_staged_background_tasks(
+                staged_background_tasks=staged_background_tasks,
+                background_tasks=self._background_tasks,
+            )
+        return [
+            {"error_status": error_status, "message": message}
+            for error_status, message in registration_results
+        ]
 
 
 def maybe_register_datapoint_at_roboflow(
     image: WorkflowImageData,
     prediction: Optional[Union[sv.Detections, dict]],
     target_project: str,
-    usage_quota_name: str,
     data_percentage: float,
     persist_predictions: bool,
-    minutely_usage_limit: int,
-    hourly_usage_limit: int,
-    daily_usage_limit: int,
+    matching_strategies_limits: "OrderedDict[str, List[StrategyLimit]]",
     max_image_size: Tuple[int, int],
     compression_level: int,
     registration_tags: List[str],
     fire_and_forget: bool,
-    labeling_batch_prefix: str,
-    new_labeling_batch_frequency: BatchCreationFrequency,
+    batch_name: str,
     cache: BaseCache,
     background_tasks: Optional[BackgroundTasks],
     thread_pool_executor: Optional[ThreadPoolExecutor],
@@ -304,17 +337,13 @@ def maybe_register_datapoint_at_roboflow(
             image=image,
             prediction=prediction,
             target_project=target_project,
-            usage_quota_name=usage_quota_name,
             persist_predictions=persist_predictions,
-            minutely_usage_limit=minutely_usage_limit,
-            hourly_usage_limit=hourly_usage_limit,
-            daily_usage_limit=daily_usage_limit,
+            matching_strategies_limits=matching_strategies_limits,
             max_image_size=max_image_size,
             compression_level=compression_level,
             registration_tags=registration_tags,
             fire_and_forget=fire_and_forget,
-            labeling_batch_prefix=labeling_batch_prefix,
-            new_labeling_batch_frequency=new_labeling_batch_frequency,
+            batch_name=batch_name,
             cache=cache,
             background_tasks=background_tasks,
             thread_pool_executor=thread_pool_executor,
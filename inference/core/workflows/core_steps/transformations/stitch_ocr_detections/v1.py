@@ -3,7 +3,7 @@ from typing import Dict, List, Literal, Optional, Tuple, Type, Union
 
 import numpy as np
 import supervision as sv
-from pydantic import AliasChoices, ConfigDict, Field, field_validator
+from pydantic import AliasChoices, ConfigDict, Field, PositiveInt
 
 from inference.core.workflows.execution_engine.entities.base import (
     Batch,
@@ -135,24 +135,15 @@ class BlockManifest(WorkflowBlockManifest):
             }
         },
     )
-    tolerance: Union[int, WorkflowParameterSelector(kind=[INTEGER_KIND])] = Field(
-        title="Tolerance",
-        description="The tolerance for grouping detections into the same line of text.",
-        default=10,
-        examples=[10, "$inputs.tolerance"],
+    tolerance: Union[PositiveInt, WorkflowParameterSelector(kind=[INTEGER_KIND])] = (
+        Field(
+            title="Tolerance",
+            description="The tolerance for grouping detections into the same line of text.",
+            default=10,
+            examples=[10, "$inputs.tolerance"],
+        )
     )
 
-    @field_validator("tolerance")
-    @classmethod
-    def ensure_tolerance_greater_than_zero(
-        cls, value: Union[int, str]
-    ) -> Union[int, str]:
-        if isinstance(value, int) and value <= 0:
-            raise ValueError(
-                "Stitch OCR detections block expects `tollerance` to be greater than zero."
-            )
-        return value
-
     @classmethod
     def accepts_batch_input(cls) -> bool:
         return True
@@ -1,4 +1,4 @@
-from typing import List, Literal, Optional, Type, Union
+from typing import Callable, Dict, List, Literal, Optional, Type, Union
 
 import supervision as sv
 from pydantic import ConfigDict, Field
@@ -203,39 +203,9 @@ class LabelVisualizationBlockV1(ColorableVisualizationBlock):
             border_radius,
         )
 
-        if text == "Class":
-            labels = predictions["class_name"]
-        elif text == "Tracker Id":
-            labels = [str(t) if t else "" for t in predictions.tracker_id]
-        elif text == "Time In Zone":
-            if "time_in_zone" in predictions.data:
-                labels = [
-                    f"In zone: {round(t, 2)}s" if t else "In zone: N/A"
-                    for t in predictions.data["time_in_zone"]
-                ]
-            else:
-                labels = [f"In zone: N/A"] * len(predictions)
-        elif text == "Confidence":
-            labels = [f"{confidence:.2f}" for confidence in predictions.confidence]
-        elif text == "Class and Confidence":
-            labels = [
-                f"{class_name} {confidence:.2f}"
-                for class_name, confidence in zip(
-                    predictions["class_name"], predictions.confidence
-                )
-            ]
-        elif text == "Index":
-            labels = [str(i) for i in range(len(predictions))]
-        elif text == "Dimensions":
-            # rounded ints: center x, center y wxh from predictions[i].xyxy
-            labels = []
-            for i in range(len(predictions)):
-                x1, y1, x2, y2 = predictions.xyxy[i]
-                cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
-                w, h = x2 - x1, y2 - y1
-                labels.append(f"{int(cx)}, {int(cy)} {int(w)}x{int(h)}")
-        elif text == "Area":
-            labels = [str(int(area)) for area in predictions.area]
+        labels_generator = TEXT_TO_LABELS_GENERATOR.get(text)
+        if labels_generator is not None:
+            labels = labels_generator(predictions)
         else:
             try:
                 labels = [str(d) if d else "" for d in predictions[text]]
@@ -252,3 +222,44 @@ class LabelVisualizationBlockV1(ColorableVisualizationBlock):
                 origin_image_data=image, numpy_image=annotated_image
             )
         }
+
+
+def get_time_in_zone_labels(predictions: sv.Detections) -> List[str]:
+    if "time_in_zone" not in predictions.data:
+        return [f"In zone: N/A"] * len(predictions)
+    return [
+        f"In zone: {round(t, 2)}s" if t else "In zone: N/A"
+        for t in predictions.data["time_in_zone"]
+    ]
+
+
+def get_dimensions_labels(predictions: sv.Detections) -> List[str]:
+    # rounded ints: center x, center y wxh from predictions[i].xyxy
+    labels = []
+    for i in range(len(predictions)):
+        x1, y1, x2, y2 = predictions.xyxy[i]
+        cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+        w, h = x2 - x1, y2 - y1
+        labels.append(f"{int(cx)}, {int(cy)} {int(w)}x{int(h)}")
+    return labels
+
+
+TEXT_TO_LABELS_GENERATOR: Dict[str, Callable[[sv.Detections], List[str]]] = {
+    "Class": lambda predictions: predictions["class_name"],
+    "Tracker Id": lambda predictions: [
+        str(t) if t else "" for t in predictions.tracker_id
+    ],
+    "Time In Zone": get_time_in_zone_labels,
+    "Confidence": lambda predictions: [
+        f"{confidence:.2f}" for confidence in predictions.confidence
+    ],
+    "Class and Confidence": lambda predictions: [
+        f"{class_name} {confidence:.2f}"
+        for class_name, confidence in zip(
+            predictions["class_name"], predictions.confidence
+        )
+    ],
+    "Index": lambda predictions: [str(i) for i in range(len(predictions))],
+    "Dimensions": get_dimensions_labels,
+    "Area": lambda predictions: [str(int(area)) for area in predictions.area],
+}
@@ -2,7 +2,7 @@ from typing import Dict, List, Literal, Optional, Tuple, Type, Union
 
 import cv2
 import numpy as np
-from pydantic import ConfigDict, Field, field_validator
+from pydantic import ConfigDict, Field, PositiveInt
 
 from inference.core.workflows.core_steps.visualizations.common.base import (
     OUTPUT_IMAGE_KEY,
@@ -56,21 +56,12 @@ class ReferencePathVisualizationManifest(VisualizationManifest):
         default="#5bb573",
         examples=["WHITE", "#FFFFFF", "rgb(255, 255, 255)" "$inputs.background_color"],
     )
-    thickness: Union[int, WorkflowParameterSelector(kind=[INTEGER_KIND])] = Field(  # type: ignore
+    thickness: Union[PositiveInt, WorkflowParameterSelector(kind=[INTEGER_KIND])] = Field(  # type: ignore
         description="Thickness of the lines in pixels.",
         default=2,
         examples=[2, "$inputs.thickness"],
     )
 
-    @field_validator("thickness")
-    @classmethod
-    def validate_thickness_greater_than_zero(
-        cls, value: Union[int, str]
-    ) -> Union[int, str]:
-        if isinstance(value, int) and value <= 0:
-            raise ValueError("Thickness must be greater or equal to zero")
-        return value
-
     @classmethod
     def get_execution_engine_compatibility(cls) -> Optional[str]:
         return ">=1.2.0,<2.0.0"
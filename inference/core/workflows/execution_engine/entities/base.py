@@ -99,6 +99,7 @@ B = TypeVar("B")
 
 
 class Batch(Generic[B]):
+    __slots__ = ("_content", "_indices")
 
     @classmethod
     def init(
@@ -204,6 +205,14 @@ class ImageParentMetadata:
 
 
 class WorkflowImageData:
+    __slots__ = (
+        "_parent_metadata",
+        "_workflow_root_ancestor_metadata",
+        "_image_reference",
+        "_base64_image",
+        "_numpy_image",
+        "_video_metadata",
+    )
 
     def __init__(
         self,
@@ -290,24 +299,30 @@ class WorkflowImageData:
         Creates new instance of `WorkflowImageData` being a crop of original image,
         making adjustment to all metadata.
         """
+        origin_height, origin_width = origin_image_data.numpy_image.shape[:2]
         parent_metadata = ImageParentMetadata(
             parent_id=crop_identifier,
             origin_coordinates=OriginCoordinatesSystem(
                 left_top_x=offset_x,
                 left_top_y=offset_y,
-                origin_width=origin_image_data.numpy_image.shape[1],
-                origin_height=origin_image_data.numpy_image.shape[0],
+                origin_width=origin_width,
+                origin_height=origin_height,
             ),
         )
-        workflow_root_ancestor_coordinates = replace(
-            origin_image_data.workflow_root_ancestor_metadata.origin_coordinates,
-            left_top_x=origin_image_data.workflow_root_ancestor_metadata.origin_coordinates.left_top_x
-            + offset_x,
-            left_top_y=origin_image_data.workflow_root_ancestor_metadata.origin_coordinates.left_top_y
-            + offset_y,
+        origin_root_ancestor_metadata = (
+            origin_image_data.workflow_root_ancestor_metadata
+        )
+        origin_root_ancestor_coordinates = (
+            origin_root_ancestor_metadata.origin_coordinates
+        )
+        workflow_root_ancestor_coordinates = OriginCoordinatesSystem(
+            left_top_x=origin_root_ancestor_coordinates.left_top_x + offset_x,
+            left_top_y=origin_root_ancestor_coordinates.left_top_y + offset_y,
+            origin_width=origin_root_ancestor_coordinates.origin_width,
+            origin_height=origin_root_ancestor_coordinates.origin_height,
         )
         workflow_root_ancestor_metadata = ImageParentMetadata(
-            parent_id=origin_image_data.workflow_root_ancestor_metadata.parent_id,
+            parent_id=origin_root_ancestor_metadata.parent_id,
             origin_coordinates=workflow_root_ancestor_coordinates,
         )
         video_metadata = None
@@ -1,4 +1,5 @@
-from typing import List, Optional
+from functools import lru_cache, partial
+from typing import List, Optional, Tuple
 
 from pydantic import AliasChoices, BaseModel, Field, StringConstraints
 from typing_extensions import Annotated
@@ -1048,14 +1049,33 @@ RoboflowModelField = Field(
 )
 
 
+# bounded, as dynamic blocks declare selectors with arbitrary kinds
+SELECTOR_TYPES_CACHE_SIZE = 512
+
+
+def _add_selector_schema_extra(
+    schema: dict, selected_element: str, kind: Tuple[Kind, ...]
+) -> None:
+    # selector types are shared between manifests - schema metadata is built on each
+    # schema generation, instead of sharing mutable dict between all of them
+    schema[REFERENCE_KEY] = True
+    schema[SELECTED_ELEMENT_KEY] = selected_element
+    schema[KIND_KEY] = [k.dict() for k in kind]
+
+
 def StepOutputSelector(kind: Optional[List[Kind]] = None):
     if kind is None:
         kind = [WILDCARD_KIND]
-    json_schema_extra = {
-        REFERENCE_KEY: True,
-        SELECTED_ELEMENT_KEY: STEP_OUTPUT_AS_SELECTED_ELEMENT,
-        KIND_KEY: [k.dict() for k in kind],
-    }
+    return _build_step_output_selector(kind=tuple(kind))
+
+
+@lru_cache(maxsize=SELECTOR_TYPES_CACHE_SIZE)
+def _build_step_output_selector(kind: Tuple[Kind, ...]):
+    json_schema_extra = partial(
+        _add_selector_schema_extra,
+        selected_element=STEP_OUTPUT_AS_SELECTED_ELEMENT,
+        kind=kind,
+    )
     return Annotated[
         str,
         StringConstraints(pattern=r"^\$steps\.[A-Za-z_\-0-9]+\.[A-Za-z_*0-9\-]+$"),
@@ -1066,11 +1086,16 @@ def StepOutputSelector(kind: Optional[List[Kind]] = None):
 def WorkflowParameterSelector(kind: Optional[List[Kind]] = None):
     if kind is None:
         kind = [WILDCARD_KIND]
-    json_schema_extra = {
-        REFERENCE_KEY: True,
-        SELECTED_ELEMENT_KEY: "workflow_parameter",
-        KIND_KEY: [k.dict() for k in kind],
-    }
+    return _build_workflow_parameter_selector(kind=tuple(kind))
+
+
+@lru_cache(maxsize=SELECTOR_TYPES_CACHE_SIZE)
+def _build_workflow_parameter_selector(kind: Tuple[Kind, ...]):
+    json_schema_extra = partial(
+        _add_selector_schema_extra,
+        selected_element="workflow_parameter",
+        kind=kind,
+    )
     return Annotated[
         str,
         StringConstraints(pattern=r"^\$inputs.[A-Za-z_0-9\-]+$"),
@@ -2,6 +2,7 @@ import itertools
 from collections import OrderedDict, defaultdict
 from dataclasses import replace
 from typing import Dict, Optional, Type
+from weakref import WeakKeyDictionary
 
 from inference.core.workflows.execution_engine.entities.types import (
     KIND_KEY,
@@ -17,7 +18,7 @@ from inference.core.workflows.execution_engine.introspection.entities import (
 )
 from inference.core.workflows.prototypes.block import WorkflowBlockManifest
 
-EXCLUDED_PROPERTIES = {"type"}
+EXCLUDED_PROPERTIES = frozenset({"type"})
 
 TYPE_MAPPING = {
     "number": "float",
@@ -49,20 +50,30 @@ ANY_OF_KEY = "anyOf"
 ONE_OF_KEY = "oneOf"
 OBJECT_TYPE = "object"
 
+# manifest class -> parsed manifest; weak keys let dynamic blocks classes be collected
+_PARSED_MANIFESTS_CACHE: "WeakKeyDictionary[type, BlockManifestMetadata]" = (
+    WeakKeyDictionary()
+)
+
 
 def parse_block_manifest(
     manifest_type: Type[WorkflowBlockManifest],
 ) -> BlockManifestMetadata:
+    parsed_manifest = _PARSED_MANIFESTS_CACHE.get(manifest_type)
+    if parsed_manifest is not None:
+        return parsed_manifest
     schema = manifest_type.model_json_schema()
     inputs_dimensionality_offsets = manifest_type.get_input_dimensionality_offsets()
     dimensionality_reference_property = (
         manifest_type.get_dimensionality_reference_property()
     )
-    return parse_block_manifest_schema(
+    parsed_manifest = parse_block_manifest_schema(
         schema=schema,
         inputs_dimensionality_offsets=inputs_dimensionality_offsets,
         dimensionality_reference_property=dimensionality_reference_property,
     )
+    _PARSED_MANIFESTS_CACHE[manifest_type] = parsed_manifest
+    return parsed_manifest
 
 
 def parse_block_manifest_schema(
@@ -11,11 +11,14 @@ from inference.core.workflows.execution_engine.introspection.schema_parser impor
 from inference.core.workflows.execution_engine.v1.compiler.utils import is_selector
 from inference.core.workflows.prototypes.block import WorkflowBlockManifest
 
+_MISSING_PROPERTY = object()
+
 
 def get_step_selectors(
     step_manifest: WorkflowBlockManifest,
 ) -> List[ParsedSelector]:
     parsed_schema = parse_block_manifest(manifest_type=type(step_manifest))
+    step_name = step_manifest.name
     result = []
     for selector_definition in parsed_schema.selectors.values():
         property_name = selector_definition.property_name
@@ -25,21 +28,21 @@ def get_step_selectors(
         )
         if selector_definition.is_list_element:
             selectors = retrieve_selectors_from_array(
-                step_name=step_manifest.name,
+                step_name=step_name,
                 property_value=property_value,
                 selector_definition=selector_definition,
             )
             result.extend(selectors)
         elif selector_definition.is_dict_element:
             selectors = retrieve_selectors_from_dictionary(
-                step_name=step_manifest.name,
+                step_name=step_name,
                 property_value=property_value,
                 selector_definition=selector_definition,
             )
             result.extend(selectors)
         else:
             selector = retrieve_selector_from_simple_property(
-                step_name=step_manifest.name,
+                step_name=step_name,
                 property_value=property_value,
                 selector_definition=selector_definition,
             )
@@ -50,7 +53,8 @@ def get_step_selectors(
 def retrieve_property_from_manifest(
     step_manifest: WorkflowBlockManifest, property_name: str
 ) -> Any:
-    if not hasattr(step_manifest, property_name):
+    property_value = getattr(step_manifest, property_name, _MISSING_PROPERTY)
+    if property_value is _MISSING_PROPERTY:
         raise BlockInterfaceError(
             public_message=f"Attempted to retrieve property {property_name} from "
             f"manifest of step {step_manifest.name} based od manifest schema, but property "
@@ -58,7 +62,7 @@ def retrieve_property_from_manifest(
             f"name in pydantic class, which is not allowed.",
             context="workflow_compilation | execution_graph_construction",
         )
-    return getattr(step_manifest, property_name)
+    return property_value
 
 
 def retrieve_selectors_from_array(
@@ -86,7 +86,7 @@ from inference.core.workflows.prototypes.block import WorkflowBlockManifest
 
 NODE_DEFINITION_KEY = "definition"
 STEP_INPUT_SELECTORS_PROPERTY = "step_input_selectors"
-EXCLUDED_FIELDS = {"type", "name"}
+EXCLUDED_FIELDS = frozenset({"type", "name"})
 
 
 @execution_phase(
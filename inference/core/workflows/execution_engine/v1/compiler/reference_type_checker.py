@@ -1,7 +1,7 @@
 from typing import List
 
 from inference.core.workflows.errors import ReferenceTypeError
-from inference.core.workflows.execution_engine.entities.types import Kind
+from inference.core.workflows.execution_engine.entities.types import WILDCARD_KIND, Kind
 
 
 def validate_reference_kinds(
@@ -9,12 +9,16 @@ def validate_reference_kinds(
     actual: List[Kind],
     error_message: str,
 ) -> None:
-    expected_kind_names = set(e.name for e in expected)
-    actual_kind_names = set(a.name for a in actual)
-    if "*" in expected_kind_names or "*" in actual_kind_names:
+    expected_kind_names = {e.name for e in expected}
+    if WILDCARD_KIND.name in expected_kind_names:
         return None
-    if len(expected_kind_names.intersection(actual_kind_names)) == 0:
-        raise ReferenceTypeError(
-            public_message=error_message,
-            context="workflow_compilation | execution_graph_construction",
-        )
+    for actual_kind in actual:
+        if (
+            actual_kind.name == WILDCARD_KIND.name
+            or actual_kind.name in expected_kind_names
+        ):
+            return None
+    raise ReferenceTypeError(
+        public_message=error_message,
+        context="workflow_compilation | execution_graph_construction",
+    )
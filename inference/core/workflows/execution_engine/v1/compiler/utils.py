@@ -113,7 +113,8 @@ def is_output_node(execution_graph: DiGraph, node: str) -> bool:
 
 
 def is_selector(selector_or_value: Any) -> bool:
-    return str(selector_or_value).startswith("$")
+    # no str() conversion - step parameters may hold large lists / dicts
+    return isinstance(selector_or_value, str) and selector_or_value.startswith("$")
 
 
 def identify_lineage(lineage: List[str]) -> int:
@@ -315,11 +315,11 @@ class BatchStepCache:
                 context="workflow_execution | step_output_registration",
             )
         for index, element in zip(indices, outputs):
-            element_properties = set(element.keys())
-            if element_properties != self._outputs:
+            # keys view compares against the set directly, without a copy per element
+            if element.keys() != self._outputs:
                 raise ExecutionEngineRuntimeError(
                     public_message=f"Step {self._step_name} did not produce required outputs. "
-                    f"Expected: {self._outputs}. Got: {element_properties}. "
+                    f"Expected: {self._outputs}. Got: {set(element.keys())}. "
                     f"Contact Roboflow team through github issues "
                     f"(https://github.com/roboflow/inference/issues) providing full context of"
                     f"the problem - including workflow definition you use.",
@@ -388,7 +388,7 @@ class NonBatchStepCache:
         self._cache_content = cache_content
 
     def register_outputs(self, outputs: Dict[str, Any]):
-        if set(outputs.keys()) != self._outputs:
+        if outputs.keys() != self._outputs:
             raise ExecutionEngineRuntimeError(
                 public_message=f"Step {self._step_name} did not produce required outputs. "
                 f"Expected: {self._outputs}. Got: {outputs.keys()}. "
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Type, Union
+from weakref import WeakKeyDictionary
 
-from openai import BaseModel
-from pydantic import ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from inference.core.workflows.errors import BlockInterfaceError
 from inference.core.workflows.execution_engine.entities.base import OutputDefinition
@@ -17,10 +17,17 @@ BlockResult = Union[
     BatchElementResult, List[BatchElementResult], List[List[BatchElementResult]]
 ]
 
+# manifest class -> outputs it declares; weak keys let dynamic blocks classes be collected
+_DECLARED_OUTPUTS_CACHE: "WeakKeyDictionary[type, List[OutputDefinition]]" = (
+    WeakKeyDictionary()
+)
+
 
 class WorkflowBlockManifest(BaseModel, ABC):
     model_config = ConfigDict(
         validate_assignment=True,
+        extra="allow",
+        defer_build=True,
     )
 
     type: str
@@ -37,7 +44,12 @@ class WorkflowBlockManifest(BaseModel, ABC):
         )
 
     def get_actual_outputs(self) -> List[OutputDefinition]:
-        return self.describe_outputs()
+        manifest_type = type(self)
+        declared_outputs = _DECLARED_OUTPUTS_CACHE.get(manifest_type)
+        if declared_outputs is None:
+            declared_outputs = self.describe_outputs()
+            _DECLARED_OUTPUTS_CACHE[manifest_type] = declared_outputs
+        return list(declared_outputs)
 
     @classmethod
     def get_input_dimensionality_offsets(cls) -> Dict[str, int]:
@@ -1,4 +1,5 @@
 import hashlib
+from collections import defaultdict
 from typing import Any, DefaultDict, Dict, List, Optional, Set, Union
 
 import requests
@@ -14,60 +15,111 @@ ResourceDetails = Dict[str, Any]
 SystemDetails = Dict[str, Any]
 UsagePayload = Union[APIKeyUsage, ResourceDetails, SystemDetails]
 
+_MISSING = object()
+
 
 def merge_usage_dicts(d1: UsagePayload, d2: UsagePayload):
-    merged = {}
-    if d1 and d2 and d1.get("resource_id") != d2.get("resource_id"):
+    if not d1:
+        return dict(d2)
+    if not d2:
+        return dict(d1)
+    if d1.get("resource_id") != d2.get("resource_id"):
         raise ValueError("Cannot merge usage for different resource IDs")
-    if "timestamp_start" in d1 and "timestamp_start" in d2:
-        merged["timestamp_start"] = min(d1["timestamp_start"], d2["timestamp_start"])
-    if "timestamp_stop" in d1 and "timestamp_stop" in d2:
-        merged["timestamp_stop"] = max(d1["timestamp_stop"], d2["timestamp_stop"])
-    if "processed_frames" in d1 and "processed_frames" in d2:
-        merged["processed_frames"] = d1["processed_frames"] + d2["processed_frames"]
-    if "source_duration" in d1 and "source_duration" in d2:
-        merged["source_duration"] = d1["source_duration"] + d2["source_duration"]
-    return {**d1, **d2, **merged}
+    merged = dict(d1)
+    merged.update(d2)
+    start_1 = d1.get("timestamp_start", _MISSING)
+    start_2 = d2.get("timestamp_start", _MISSING)
+    if start_1 is not _MISSING and start_2 is not _MISSING:
+        merged["timestamp_start"] = start_2 if start_2 < start_1 else start_1
+    stop_1 = d1.get("timestamp_stop", _MISSING)
+    stop_2 = d2.get("timestamp_stop", _MISSING)
+    if stop_1 is not _MISSING and stop_2 is not _MISSING:
+        merged["timestamp_stop"] = stop_2 if stop_2 > stop_1 else stop_1
+    frames_1 = d1.get("processed_frames", _MISSING)
+    frames_2 = d2.get("processed_frames", _MISSING)
+    if frames_1 is not _MISSING and frames_2 is not _MISSING:
+        merged["processed_frames"] = frames_1 + frames_2
+    duration_1 = d1.get("source_duration", _MISSING)
+    duration_2 = d2.get("source_duration", _MISSING)
+    if duration_1 is not _MISSING and duration_2 is not _MISSING:
+        merged["source_duration"] = duration_1 + duration_2
+    return merged
 
 
 def get_api_key_usage_containing_resource(
     api_key_hash: APIKey, usage_payloads: List[APIKeyUsage]
 ) -> Optional[ResourceUsage]:
+    if api_key_hash:
+        for usage_payload in usage_payloads:
+            resource_payloads = usage_payload.get(api_key_hash)
+            if not resource_payloads:
+                continue
+            resource_usage = get_first_usage_with_resource(
+                resource_payloads=resource_payloads
+            )
+            if resource_usage:
+                return resource_usage
+        return
     for usage_payload in usage_payloads:
         for other_api_key_hash, resource_payloads in usage_payload.items():
-            if api_key_hash and other_api_key_hash != api_key_hash:
-                continue
             if other_api_key_hash == "":
                 continue
-            for resource_id, resource_usage in resource_payloads.items():
-                if not resource_id:
-                    continue
-                if not resource_usage or "resource_id" not in resource_usage:
-                    continue
+            resource_usage = get_first_usage_with_resource(
+                resource_payloads=resource_payloads
+            )
+            if resource_usage:
                 return resource_usage
     return
 
 
+def get_first_usage_with_resource(
+    resource_payloads: ResourceUsage,
+) -> Optional[Usage]:
+    for resource_id, resource_usage in resource_payloads.items():
+        if not resource_id:
+            continue
+        if not resource_usage or "resource_id" not in resource_usage:
+            continue
+        return resource_usage
+    return
+
+
+def index_api_keys_usage_containing_resource(
+    usage_payloads: List[APIKeyUsage],
+) -> Dict[APIKeyHash, ResourceUsage]:
+    index: Dict[APIKeyHash, ResourceUsage] = {}
+    for usage_payload in usage_payloads:
+        for api_key_hash, resource_payloads in usage_payload.items():
+            if api_key_hash == "" or api_key_hash in index:
+                continue
+            resource_usage = get_first_usage_with_resource(
+                resource_payloads=resource_payloads
+            )
+            if resource_usage:
+                index[api_key_hash] = resource_usage
+    return index
+
+
 def zip_usage_payloads(usage_payloads: List[APIKeyUsage]) -> List[APIKeyUsage]:
+    api_keys_usage_containing_resource = index_api_keys_usage_containing_resource(
+        usage_payloads=usage_payloads
+    )
     system_info_payload = None
-    usage_by_exec_session_id: Dict[
-        APIKeyHash, Dict[ResourceID, Dict[str, List[ResourceUsage]]]
-    ] = {}
+    usage_by_exec_session_id: DefaultDict[
+        APIKeyHash, DefaultDict[ResourceID, DefaultDict[str, List[ResourceUsage]]]
+    ] = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
     for usage_payload in usage_payloads:
         for api_key_hash, resource_payloads in usage_payload.items():
             if api_key_hash == "":
                 continue
-            api_key_usage_by_exec_session_id = usage_by_exec_session_id.setdefault(
-                api_key_hash, {}
-            )
+            api_key_usage_by_exec_session_id = usage_by_exec_session_id[api_key_hash]
             for (
                 resource_usage_key,
                 resource_usage_payload,
             ) in resource_payloads.items():
                 if resource_usage_key == "":
-                    api_key_usage_with_resource = get_api_key_usage_containing_resource(
-                        api_key_hash=api_key_hash,
-                        usage_payloads=usage_payloads,
+                    api_key_usage_with_resource = (
+                        api_keys_usage_containing_resource.get(api_key_hash)
                     )
                     if not api_key_usage_with_resource:
                         system_info_payload = {"": resource_usage_payload}
@@ -79,20 +131,20 @@ def zip_usage_payloads(usage_payloads: List[APIKeyUsage]) -> List[APIKeyUsage]:
                     resource_usage_payload["resource_id"] = resource_id
                     resource_usage_payload["category"] = category
 
-                resource_usage_exec_session_id = (
-                    api_key_usage_by_exec_session_id.setdefault(resource_usage_key, {})
-                )
+                resource_usage_exec_session_id = api_key_usage_by_exec_session_id[
+                    resource_usage_key
+                ]
                 if not resource_usage_payload.get("fps"):
-                    resource_usage_exec_session_id.setdefault("", []).append(
-                        resource_usage_payload
-                    )
+                    resource_usage_exec_session_id[""].append(resource_usage_payload)
                     continue
                 exec_session_id = resource_usage_payload.get("exec_session_id", "")
-                resource_usage_exec_session_id.setdefault(exec_session_id, []).append(
+                resource_usage_exec_session_id[exec_session_id].append(
                     resource_usage_payload
                 )
 
-    merged_exec_session_id_usage_payloads: Dict[str, APIKeyUsage] = {}
+    merged_exec_session_id_usage_payloads: DefaultDict[str, APIKeyUsage] = defaultdict(
+        lambda: defaultdict(dict)
+    )
     for (
         api_key_hash,
         api_key_usage_by_exec_session_id,
@@ -105,24 +157,23 @@ def zip_usage_payloads(usage_payloads: List[APIKeyUsage]) -> List[APIKeyUsage]:
                 exec_session_id,
                 usage_payloads,
             ) in resource_usage_exec_session_id.items():
-                merged_api_key_usage_payloads = (
-                    merged_exec_session_id_usage_payloads.setdefault(
-                        exec_session_id, {}
-                    )
-                )
-                merged_api_key_payload = merged_api_key_usage_payloads.setdefault(
-                    api_key_hash, {}
+                merged_api_key_payload = merged_exec_session_id_usage_payloads[
+                    exec_session_id
+                ][api_key_hash]
+                merged_resource_payload = merged_api_key_payload.get(
+                    resource_usage_key, {}
                 )
                 for resource_usage_payload in usage_payloads:
-                    merged_resource_payload = merged_api_key_payload.setdefault(
-                        resource_usage_key, {}
-                    )
-                    merged_api_key_payload[resource_usage_key] = merge_usage_dicts(
+                    merged_resource_payload = merge_usage_dicts(
                         merged_resource_payload,
                         resource_usage_payload,
                     )
+                merged_api_key_payload[resource_usage_key] = merged_resource_payload
 
-    zipped_payloads = list(merged_exec_session_id_usage_payloads.values())
+    zipped_payloads = [
+        dict(api_keys_usage)
+        for api_keys_usage in merged_exec_session_id_usage_payloads.values()
+    ]
     if system_info_payload:
         system_info_api_key_hash = next(iter(system_info_payload.values()))[
             "api_key_hash"
@@ -2,10 +2,11 @@ from queue import Queue
 from unittest import mock
 from unittest.mock import MagicMock, call
 
+import cv2
 import numpy as np
 import pytest
 
-from inference.core.active_learning import middlewares
+from inference.core.active_learning import core, middlewares
 from inference.core.active_learning.middlewares import (
     ActiveLearningMiddleware,
     ThreadingActiveLearningMiddleware,
@@ -166,6 +167,58 @@ def test_active_learning_registration_when_datapoint_is_to_be_registered(
     )
 
 
+@mock.patch.object(core, "register_datapoint_at_roboflow")
+@mock.patch.object(core, "use_credit_of_matching_strategy")
+@mock.patch.object(middlewares, "image_can_be_submitted_to_batch")
+@mock.patch.object(middlewares, "generate_batch_name")
+@mock.patch.object(middlewares, "execute_sampling")
+@mock.patch.object(middlewares, "load_image")
+def test_active_learning_registration_when_rgb_image_is_registered(
+    load_image_mock: MagicMock,
+    execute_sampling_mock: MagicMock,
+    generate_batch_name_mock: MagicMock,
+    image_can_be_submitted_to_batch_mock: MagicMock,
+    use_credit_of_matching_strategy_mock: MagicMock,
+    register_datapoint_at_roboflow_mock: MagicMock,
+) -> None:
+    # given
+    rgb_image = np.full((64, 96, 3), (200, 100, 30), dtype=np.uint8)
+    load_image_mock.return_value = rgb_image, False
+    execute_sampling_mock.return_value = ["strategy-a"]
+    generate_batch_name_mock.return_value = "some-batch"
+    image_can_be_submitted_to_batch_mock.return_value = True
+    use_credit_of_matching_strategy_mock.return_value = "strategy-a"
+    configuration = MagicMock()
+    configuration.max_image_size = None
+    configuration.jpeg_compression_level = 100
+    configuration.strategies_limits = {"strategy-a": []}
+    middleware = ActiveLearningMiddleware(
+        api_key="api-key",
+        configuration=configuration,
+        cache=MagicMock(),
+    )
+
+    # when
+    middleware.register(
+        inference_input="some-image",
+        prediction={"some": "prediction"},
+        prediction_type="object-detection",
+    )
+
+    # then
+    register_datapoint_at_roboflow_mock.assert_called_once()
+    encoded_image = register_datapoint_at_roboflow_mock.call_args[1]["encoded_image"]
+    decoded_image = cv2.imdecode(
+        np.frombuffer(encoded_image, dtype=np.uint8), cv2.IMREAD_COLOR
+    )
+    assert (
+        decoded_image.shape == rgb_image.shape
+    ), "Expected registered image to keep the size of the input"
+    assert np.allclose(
+        decoded_image.astype(np.int16), rgb_image[:, :, ::-1].astype(np.int16), atol=2
+    ), "Expected registered image to hold input pixels in BGR channel order"
+
+
 @mock.patch.object(middlewares, "load_image")
 def test_active_learning_registration_when_error_raised(
     load_image_mock: MagicMock,
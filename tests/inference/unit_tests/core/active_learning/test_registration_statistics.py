@@ -0,0 +1,40 @@
+from inference.core.active_learning.registration_statistics import (
+    RegistrationOutcome,
+    RegistrationStatistics,
+)
+
+
+def test_registration_statistics_when_nothing_recorded() -> None:
+    # given
+    statistics = RegistrationStatistics()
+
+    # when
+    result = statistics.snapshot()
+
+    # then
+    assert result == {
+        "succeeded": 0,
+        "failed": 0,
+        "skipped": 0,
+        "total_duration": 0.0,
+    }, "Expected all counters to be zeroed"
+
+
+def test_registration_statistics_when_outcomes_recorded() -> None:
+    # given
+    statistics = RegistrationStatistics()
+
+    # when
+    statistics.record(outcome=RegistrationOutcome.SUCCEEDED, duration=0.5)
+    statistics.record(outcome=RegistrationOutcome.SUCCEEDED, duration=0.25)
+    statistics.record(outcome=RegistrationOutcome.FAILED, duration=1.0)
+    statistics.record(outcome=RegistrationOutcome.SKIPPED, duration=0.25)
+    result = statistics.snapshot()
+
+    # then
+    assert result == {
+        "succeeded": 2,
+        "failed": 1,
+        "skipped": 1,
+        "total_duration": 2.0,
+    }, "Expected each outcome to be counted separately and durations to be summed up"
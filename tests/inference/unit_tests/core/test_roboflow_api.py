@@ -1,10 +1,13 @@
 import json
+import threading
+from http.client import HTTPMessage
 from typing import Type
 from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 import requests.exceptions
+from requests.cookies import MockRequest, MockResponse
 from requests_mock import Mocker
 
 from inference.core import roboflow_api
@@ -681,7 +684,7 @@ def test_get_roboflow_model_data_when_valid_response_expected(
     assert result == expected_response
 
 
-@mock.patch.object(roboflow_api.requests, "post")
+@mock.patch.object(roboflow_api.requests.Session, "post")
 def test_register_image_at_roboflow_when_connection_error_occurs(
     post_mock: MagicMock,
 ) -> None:
@@ -983,7 +986,43 @@ def test_register_image_at_roboflow_when_lack_of_success_reported(
     assert str({"success": False}) in str(e.value)
 
 
-@mock.patch.object(roboflow_api.requests, "post")
+def test_get_roboflow_upload_session_when_called_from_different_threads() -> None:
+    # given
+    sessions = []
+
+    # when
+    first_session = roboflow_api._get_roboflow_upload_session()
+    second_session = roboflow_api._get_roboflow_upload_session()
+    thread = threading.Thread(
+        target=lambda: sessions.append(roboflow_api._get_roboflow_upload_session())
+    )
+    thread.start()
+    thread.join()
+
+    # then
+    assert first_session is second_session, "Expected session to be re-used in thread"
+    assert (
+        sessions[0] is not first_session
+    ), "Expected session not to be shared between threads"
+
+
+def test_get_roboflow_upload_session_when_response_sets_cookie() -> None:
+    # given
+    session = roboflow_api._get_roboflow_upload_session()
+    headers = HTTPMessage()
+    headers["Set-Cookie"] = "session_id=secret; Path=/"
+    request = requests.Request(
+        method="POST", url=f"{API_BASE_URL}/dataset/coins_detection/upload"
+    ).prepare()
+
+    # when
+    session.cookies.extract_cookies(MockResponse(headers), MockRequest(request))
+
+    # then
+    assert len(session.cookies) == 0, "Expected cookies not to be persisted in session"
+
+
+@mock.patch.object(roboflow_api.requests.Session, "post")
 def test_annotate_image_at_roboflow_when_connection_error_occurs(
     post_mock: MagicMock,
 ) -> None:
@@ -9,6 +9,7 @@ from inference.core.version import __version__ as inference_version
 from inference.usage_tracking.collector import UsageCollector
 from inference.usage_tracking.payload_helpers import (
     get_api_key_usage_containing_resource,
+    index_api_keys_usage_containing_resource,
     merge_usage_dicts,
     sha256_hash,
     zip_usage_payloads,
@@ -79,6 +80,26 @@ def test_merge_usage_dicts_merge_with_empty():
     assert merge_usage_dicts(d1=usage_payload_2, d2=usage_payload_1) == usage_payload_1
 
 
+def test_merge_usage_dicts_when_one_of_operands_is_empty_dict():
+    # given
+    usage_payload = {
+        "resource_id": "some",
+        "api_key_hash": "some",
+        "processed_frames": 1,
+    }
+
+    # when
+    result_1 = merge_usage_dicts(d1={}, d2=usage_payload)
+    result_2 = merge_usage_dicts(d1=usage_payload, d2={})
+
+    # then
+    assert result_1 == usage_payload
+    assert result_2 == usage_payload
+    assert (
+        result_1 is not usage_payload and result_2 is not usage_payload
+    ), "Expected merge result to be a copy of non-empty operand"
+
+
 def test_merge_usage_dicts():
     # given
     usage_payload_1 = {
@@ -227,6 +248,109 @@ def test_get_api_key_usage_containing_resource():
     }
 
 
+def test_get_api_key_usage_containing_resource_when_api_key_hash_is_empty():
+    # given
+    usage_payloads = [
+        {
+            "": {
+                "resource1": {
+                    "api_key_hash": "",
+                    "resource_id": "resource1",
+                    "processed_frames": 1,
+                },
+            },
+            "fake_api1_hash": {
+                "": {"api_key_hash": "fake_api1_hash", "is_gpu_available": False},
+            },
+        },
+        {
+            "fake_api2_hash": {
+                "resource2": {
+                    "api_key_hash": "fake_api2_hash",
+                    "resource_id": "resource2",
+                    "processed_frames": 1,
+                },
+            },
+        },
+    ]
+
+    # when
+    api_key_usage_with_resource = get_api_key_usage_containing_resource(
+        api_key_hash="", usage_payloads=usage_payloads
+    )
+
+    # then
+    assert api_key_usage_with_resource == {
+        "api_key_hash": "fake_api2_hash",
+        "resource_id": "resource2",
+        "processed_frames": 1,
+    }, "Expected first usage with resource under any non-empty API key to be returned"
+
+
+def test_index_api_keys_usage_containing_resource():
+    # given
+    usage_payloads = [
+        {
+            "": {
+                "": {"api_key_hash": "", "is_gpu_available": False},
+            },
+            "fake_api1_hash": {
+                "": {"api_key_hash": "fake_api1_hash", "is_gpu_available": False},
+            },
+        },
+        {
+            "fake_api1_hash": {
+                "resource1": {
+                    "api_key_hash": "fake_api1_hash",
+                    "resource_id": "resource1",
+                    "processed_frames": 1,
+                },
+                "resource2": {
+                    "api_key_hash": "fake_api1_hash",
+                    "resource_id": "resource2",
+                    "processed_frames": 1,
+                },
+            },
+            "fake_api2_hash": {
+                "resource3": {},
+            },
+        },
+        {
+            "fake_api1_hash": {
+                "resource4": {
+                    "api_key_hash": "fake_api1_hash",
+                    "resource_id": "resource4",
+                    "processed_frames": 1,
+                },
+            },
+            "fake_api2_hash": {
+                "resource3": {
+                    "api_key_hash": "fake_api2_hash",
+                    "resource_id": "resource3",
+                    "processed_frames": 1,
+                },
+            },
+        },
+    ]
+
+    # when
+    index = index_api_keys_usage_containing_resource(usage_payloads=usage_payloads)
+
+    # then
+    assert index == {
+        "fake_api1_hash": {
+            "api_key_hash": "fake_api1_hash",
+            "resource_id": "resource1",
+            "processed_frames": 1,
+        },
+        "fake_api2_hash": {
+            "api_key_hash": "fake_api2_hash",
+            "resource_id": "resource3",
+            "processed_frames": 1,
+        },
+    }, "Expected first usage with resource to be indexed for each API key"
+
+
 def test_zip_usage_payloads():
     dumped_usage_payloads = [
         {
@@ -1,3 +1,4 @@
+import cv2
 import numpy as np
 import pytest
 from pydantic import ValidationError
@@ -5,6 +6,7 @@ from pydantic import ValidationError
 from inference.core.workflows.core_steps.classical_cv.threshold.v1 import (
     ImageThresholdBlockV1,
     ImageThresholdManifest,
+    apply_thresholding,
 )
 from inference.core.workflows.execution_engine.entities.base import (
     ImageParentMetadata,
@@ -78,3 +80,66 @@ def test_threshold_block(dogs_image: np.ndarray) -> None:
     assert output.get("image").numpy_image.shape == dogs_image.shape
     # check if the image is modified
     assert not np.array_equal(output.get("image").numpy_image, dogs_image)
+
+
+@pytest.mark.parametrize(
+    "threshold_type, expected_flag",
+    [
+        ("binary", cv2.THRESH_BINARY),
+        ("binary_inv", cv2.THRESH_BINARY_INV),
+        ("trunc", cv2.THRESH_TRUNC),
+        ("tozero", cv2.THRESH_TOZERO),
+        ("tozero_inv", cv2.THRESH_TOZERO_INV),
+    ],
+)
+def test_apply_thresholding_for_fixed_threshold_types(
+    dogs_image: np.ndarray,
+    threshold_type: str,
+    expected_flag: int,
+) -> None:
+    # given
+    image = cv2.cvtColor(dogs_image, cv2.COLOR_BGR2GRAY)
+
+    # when
+    result = apply_thresholding(
+        image=image, threshold_type=threshold_type, thresh_value=127, max_value=255
+    )
+
+    # then
+    _, expected_result = cv2.threshold(image, 127, 255, expected_flag)
+    assert np.array_equal(result, expected_result)
+
+
+@pytest.mark.parametrize(
+    "threshold_type, expected_method",
+    [
+        ("adaptive_mean", cv2.ADAPTIVE_THRESH_MEAN_C),
+        ("adaptive_gaussian", cv2.ADAPTIVE_THRESH_GAUSSIAN_C),
+    ],
+)
+def test_apply_thresholding_for_adaptive_threshold_types(
+    dogs_image: np.ndarray,
+    threshold_type: str,
+    expected_method: int,
+) -> None:
+    # given
+    image = cv2.cvtColor(dogs_image, cv2.COLOR_BGR2GRAY)
+
+    # when
+    result = apply_thresholding(
+        image=image, threshold_type=threshold_type, thresh_value=127, max_value=255
+    )
+
+    # then
+    expected_result = cv2.adaptiveThreshold(
+        image, 255, expected_method, cv2.THRESH_BINARY, 11, 2
+    )
+    assert np.array_equal(result, expected_result)
+
+
+def test_apply_thresholding_for_unknown_threshold_type(dogs_image: np.ndarray) -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = apply_thresholding(
+            image=dogs_image, threshold_type="unknown", thresh_value=127, max_value=255
+        )
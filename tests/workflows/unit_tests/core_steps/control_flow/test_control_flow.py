@@ -171,3 +171,39 @@ def test_continue_if_evaluation(
     assert (
         evaluation_result == expected_result
     ), f"Expected {expected_result} for condition {condition_statement} with parameters {evaluation_parameters}, but got {evaluation_result}"
+
+
+@pytest.mark.parametrize(
+    "operator, first_value, expected_result",
+    [("or", True, True), ("and", False, False)],
+)
+def test_statement_group_evaluation_short_circuits(
+    operator: str, first_value: bool, expected_result: bool
+) -> None:
+    # given
+    condition_statement = {
+        "type": "StatementGroup",
+        "operator": operator,
+        "statements": [
+            {
+                "type": "UnaryStatement",
+                "operand": {"type": "StaticOperand", "value": first_value},
+                "operator": {"type": "(Boolean) is True"},
+            },
+            {
+                "type": "UnaryStatement",
+                "operand": {"type": "DynamicOperand", "operand_name": "undeclared"},
+                "operator": {"type": "(Boolean) is True"},
+            },
+        ],
+    }
+    parsed_definition = StatementGroup.model_validate(condition_statement)
+    evaluation_function = build_eval_function(definition=parsed_definition)
+
+    # when
+    evaluation_result = evaluation_function({})
+
+    # then
+    assert (
+        evaluation_result is expected_result
+    ), "Expected result to be decided by first statement, without evaluating the second one"
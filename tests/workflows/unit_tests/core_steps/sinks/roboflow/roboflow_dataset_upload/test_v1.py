@@ -10,13 +10,18 @@ import pytest
 import supervision as sv
 from fastapi import BackgroundTasks
 
+from inference.core.active_learning.registration_statistics import (
+    get_background_registration_statistics,
+)
 from inference.core.cache import MemoryCache
 from inference.core.workflows.core_steps.sinks.roboflow.dataset_upload import v1
 from inference.core.workflows.core_steps.sinks.roboflow.dataset_upload.v1 import (
     BatchCreationFrequency,
     RoboflowDatasetUploadBlockV1,
+    build_matching_strategies_limits,
     encode_prediction,
     execute_registration,
+    execute_registration_in_background,
     generate_batch_name,
     get_workspace_name,
     is_prediction_registration_forbidden,
@@ -29,6 +34,11 @@ from inference.core.workflows.execution_engine.entities.base import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_local_caches() -> None:
+    v1._WORKSPACE_NAME_LOCAL_CACHE.clear()
+
+
 def test_encode_prediction_when_classification_prediction_provided() -> None:
     # given
     prediction = {
@@ -613,7 +623,7 @@ def test_generate_batch_name(
 def test_get_workspace_name_when_cache_contains_workspace_name() -> None:
     # given
     api_key = "my_api_key"
-    api_key_hash = hashlib.md5(api_key.encode("utf-8")).hexdigest()
+    api_key_hash = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
     expected_cache_key = f"workflows:api_key_to_workspace:{api_key_hash}"
     cache = MemoryCache()
     cache.set(key=expected_cache_key, value="my_workspace")
@@ -634,7 +644,7 @@ def test_get_workspace_name_when_cache_does_not_contain_workspace_name(
     # given
     api_key = "my_api_key"
     cache = MemoryCache()
-    api_key_hash = hashlib.md5(api_key.encode("utf-8")).hexdigest()
+    api_key_hash = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
     expected_cache_key = f"workflows:api_key_to_workspace:{api_key_hash}"
     get_roboflow_workspace_mock.return_value = "workspace_from_api"
 
@@ -650,13 +660,67 @@ def test_get_workspace_name_when_cache_does_not_contain_workspace_name(
     ), "Expected retrieved workspace to be saved in cache"
 
 
+@mock.patch.object(v1, "get_roboflow_workspace")
+def test_get_workspace_name_when_workspace_name_cached_in_process(
+    get_roboflow_workspace_mock: MagicMock,
+) -> None:
+    # given
+    api_key = "my_api_key"
+    cache = MagicMock()
+    cache.get.return_value = None
+    get_roboflow_workspace_mock.return_value = "workspace_from_api"
+
+    # when
+    results = [get_workspace_name(api_key=api_key, cache=cache) for _ in range(3)]
+
+    # then
+    assert (
+        results == ["workspace_from_api"] * 3
+    ), "Expected workspace name to be returned for each call"
+    assert cache.get.call_count == 1, "Expected shared cache to be looked up once"
+    get_roboflow_workspace_mock.assert_called_once_with(api_key=api_key)
+
+
+@mock.patch.object(v1, "WORKSPACE_NAME_LOCAL_CACHE_SIZE", 2)
+@mock.patch.object(v1, "get_roboflow_workspace")
+def test_get_workspace_name_when_local_cache_size_is_exceeded(
+    get_roboflow_workspace_mock: MagicMock,
+) -> None:
+    # given
+    cache = MagicMock()
+    cache.get.return_value = None
+    get_roboflow_workspace_mock.side_effect = lambda api_key: f"workspace_{api_key}"
+
+    # when
+    results = [
+        get_workspace_name(api_key=api_key, cache=cache)
+        for api_key in ["a", "b", "c", "a"]
+    ]
+
+    # then
+    assert results == [
+        "workspace_a",
+        "workspace_b",
+        "workspace_c",
+        "workspace_a",
+    ], "Expected workspace name to be returned for each call"
+    assert (
+        cache.get.call_count == 4
+    ), "Expected least recently used entry to be evicted from local cache"
+    assert len(v1._WORKSPACE_NAME_LOCAL_CACHE) == 2, "Expected local cache to be bound"
+    assert all(
+        key.startswith("workflows:api_key_to_workspace:")
+        for key in v1._WORKSPACE_NAME_LOCAL_CACHE
+    ), "Expected local cache not to be keyed by raw API keys"
+
+
 @mock.patch.object(v1, "use_credit_of_matching_strategy")
 def test_execute_registration_when_quota_limit_exceeded(
     use_credit_of_matching_strategy_mock: MagicMock,
 ) -> None:
     # given
     api_key = "my_api_key"
-    api_key_hash = hashlib.md5(api_key.encode("utf-8")).hexdigest()
+    api_key_hash = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
     expected_cache_key = f"workflows:api_key_to_workspace:{api_key_hash}"
     cache = MemoryCache()
     cache.set(key=expected_cache_key, value="my_workspace")
@@ -678,16 +742,17 @@ def test_execute_registration_when_quota_limit_exceeded(
         image=image,
         prediction=prediction,
         target_project="my_project",
-        usage_quota_name="my_quota",
         persist_predictions=True,
-        minutely_usage_limit=10,
-        hourly_usage_limit=100,
-        daily_usage_limit=1000,
+        matching_strategies_limits=build_matching_strategies_limits(
+            usage_quota_name="my_quota",
+            minutely_usage_limit=10,
+            hourly_usage_limit=100,
+            daily_usage_limit=1000,
+        ),
         max_image_size=(100, 100),
         compression_level=75,
         registration_tags=["some"],
-        labeling_batch_prefix="my_batch",
-        new_labeling_batch_frequency="never",
+        batch_name="my_batch",
         cache=cache,
         api_key=api_key,
     )
@@ -709,7 +774,7 @@ def test_execute_registration_when_error_in_registration_happened(
 ) -> None:
     # given
     api_key = "my_api_key"
-    api_key_hash = hashlib.md5(api_key.encode("utf-8")).hexdigest()
+    api_key_hash = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
     expected_cache_key = f"workflows:api_key_to_workspace:{api_key_hash}"
     cache = MemoryCache()
     cache.set(key=expected_cache_key, value="my_workspace")
@@ -732,16 +797,17 @@ def test_execute_registration_when_error_in_registration_happened(
         image=image,
         prediction=prediction,
         target_project="my_project",
-        usage_quota_name="my_quota",
         persist_predictions=True,
-        minutely_usage_limit=10,
-        hourly_usage_limit=100,
-        daily_usage_limit=1000,
+        matching_strategies_limits=build_matching_strategies_limits(
+            usage_quota_name="my_quota",
+            minutely_usage_limit=10,
+            hourly_usage_limit=100,
+            daily_usage_limit=1000,
+        ),
         max_image_size=(100, 100),
         compression_level=75,
         registration_tags=["some"],
-        labeling_batch_prefix="my_batch",
-        new_labeling_batch_frequency="never",
+        batch_name="my_batch",
         cache=cache,
         api_key=api_key,
     )
@@ -766,7 +832,7 @@ def test_execute_registration_when_registration_should_be_successful(
 ) -> None:
     # given
     api_key = "my_api_key"
-    api_key_hash = hashlib.md5(api_key.encode("utf-8")).hexdigest()
+    api_key_hash = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
     expected_cache_key = f"workflows:api_key_to_workspace:{api_key_hash}"
     cache = MemoryCache()
     cache.set(key=expected_cache_key, value="my_workspace")
@@ -804,16 +870,17 @@ def test_execute_registration_when_registration_should_be_successful(
         image=image,
         prediction=detections,
         target_project="my_project",
-        usage_quota_name="my_quota",
         persist_predictions=True,
-        minutely_usage_limit=10,
-        hourly_usage_limit=100,
-        daily_usage_limit=1000,
+        matching_strategies_limits=build_matching_strategies_limits(
+            usage_quota_name="my_quota",
+            minutely_usage_limit=10,
+            hourly_usage_limit=100,
+            daily_usage_limit=1000,
+        ),
         max_image_size=(128, 64),
         compression_level=75,
         registration_tags=["some"],
-        labeling_batch_prefix="my_batch",
-        new_labeling_batch_frequency="never",
+        batch_name="my_batch",
         cache=cache,
         api_key=api_key,
     )
@@ -828,6 +895,133 @@ def test_execute_registration_when_registration_should_be_successful(
     return_strategy_credit_mock.assert_not_called()
 
 
+@mock.patch.object(v1, "scale_sv_detections")
+@mock.patch.object(v1, "register_datapoint")
+@mock.patch.object(v1, "use_credit_of_matching_strategy")
+def test_execute_registration_when_image_does_not_exceed_max_size(
+    use_credit_of_matching_strategy_mock: MagicMock,
+    register_datapoint_mock: MagicMock,
+    scale_sv_detections_mock: MagicMock,
+) -> None:
+    # given
+    api_key = "my_api_key"
+    api_key_hash = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
+    expected_cache_key = f"workflows:api_key_to_workspace:{api_key_hash}"
+    cache = MemoryCache()
+    cache.set(key=expected_cache_key, value="my_workspace")
+    use_credit_of_matching_strategy_mock.return_value = "my_strategy"
+    register_datapoint_mock.return_value = "STATUS OK"
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="parent"),
+        numpy_image=np.zeros((128, 128, 3), dtype=np.uint8),
+    )
+    detections = sv.Detections(
+        xyxy=np.array([[2, 2, 4, 4]], dtype=np.float64),
+        class_id=np.array([1]),
+        confidence=np.array([0.9], dtype=np.float64),
+        data={
+            "class_name": np.array(["cat"]),
+            "image_dimensions": np.array([[128, 128]]),
+        },
+    )
+
+    # when
+    result = execute_registration(
+        image=image,
+        prediction=detections,
+        target_project="my_project",
+        persist_predictions=True,
+        matching_strategies_limits=build_matching_strategies_limits(
+            usage_quota_name="my_quota",
+            minutely_usage_limit=10,
+            hourly_usage_limit=100,
+            daily_usage_limit=1000,
+        ),
+        max_image_size=(256, 256),
+        compression_level=75,
+        registration_tags=["some"],
+        batch_name="my_batch",
+        cache=cache,
+        api_key=api_key,
+    )
+
+    # then
+    assert result == (False, "STATUS OK"), "Expected correct status to be marked"
+    scale_sv_detections_mock.assert_not_called()
+    assert (
+        register_datapoint_mock.call_args[1]["prediction"] is detections
+    ), "Expected prediction to be registered without re-scaling"
+
+
+@mock.patch.object(v1, "execute_registration")
+def test_execute_registration_in_background_when_registration_succeeds(
+    execute_registration_mock: MagicMock,
+) -> None:
+    # given
+    execute_registration_mock.return_value = (False, "STATUS OK")
+    statistics_before = get_background_registration_statistics()
+
+    # when
+    execute_registration_in_background(image="some", api_key="my_api_key")
+
+    # then
+    statistics_after = get_background_registration_statistics()
+    execute_registration_mock.assert_called_once_with(
+        image="some", api_key="my_api_key"
+    )
+    assert (
+        statistics_after["succeeded"] == statistics_before["succeeded"] + 1
+    ), "Expected success to be recorded"
+    assert (
+        statistics_after["failed"] == statistics_before["failed"]
+    ), "Expected no failure to be recorded"
+
+
+@mock.patch.object(v1, "execute_registration")
+def test_execute_registration_in_background_when_usage_quota_exceeded(
+    execute_registration_mock: MagicMock,
+) -> None:
+    # given
+    execute_registration_mock.return_value = (
+        False,
+        "Registration skipped due to usage quota exceeded",
+    )
+    statistics_before = get_background_registration_statistics()
+
+    # when
+    execute_registration_in_background(image="some", api_key="my_api_key")
+
+    # then
+    statistics_after = get_background_registration_statistics()
+    assert (
+        statistics_after["skipped"] == statistics_before["skipped"] + 1
+    ), "Expected skipped registration to be recorded"
+    assert (
+        statistics_after["succeeded"] == statistics_before["succeeded"]
+    ), "Expected no success to be recorded"
+
+
+@mock.patch.object(v1, "execute_registration")
+def test_execute_registration_in_background_when_registration_raises_error(
+    execute_registration_mock: MagicMock,
+) -> None:
+    # given
+    execute_registration_mock.side_effect = ValueError()
+    statistics_before = get_background_registration_statistics()
+
+    # when
+    execute_registration_in_background(image="some", api_key="my_api_key")
+
+    # then
+    statistics_after = get_background_registration_statistics()
+    assert (
+        statistics_after["failed"] == statistics_before["failed"] + 1
+    ), "Expected failure to be recorded instead of error being raised"
+    assert (
+        statistics_after["succeeded"] == statistics_before["succeeded"]
+    ), "Expected no success to be recorded"
+
+
 def test_run_sink_when_api_key_is_not_specified() -> None:
     # given
     data_collector_block = RoboflowDatasetUploadBlockV1(
@@ -968,7 +1162,124 @@ def test_run_sink_when_registration_should_happen_in_background_tasks() -> None:
         ]
         * 3
     ), "Expected async execution status to be presented"
-    assert len(background_tasks.tasks) == 3, "Async tasks to be added"
+    assert (
+        len(background_tasks.tasks) == 1
+    ), "Expected registrations of all elements to be bundled into single async task"
+    assert (
+        len(background_tasks.tasks[0].kwargs["tasks"]) == 3
+    ), "Expected each element to be registered within the bundled task"
+
+
+@mock.patch.object(v1, "run_in_parallel")
+@mock.patch.object(v1, "execute_registration", MagicMock())
+def test_run_sink_when_registration_should_happen_in_background_tasks_stages_elements_in_foreground(
+    run_in_parallel_mock: MagicMock,
+) -> None:
+    # given
+    background_tasks = BackgroundTasks()
+    data_collector_block = RoboflowDatasetUploadBlockV1(
+        cache=MemoryCache(),
+        api_key="my_api_key",
+        background_tasks=background_tasks,
+        thread_pool_executor=None,
+    )
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="parent"),
+        numpy_image=np.zeros((512, 256, 3), dtype=np.uint8),
+    )
+    indices = [(0,), (1,)]
+
+    # when
+    _ = data_collector_block.run(
+        images=Batch(content=[image, image], indices=indices),
+        predictions=None,
+        target_project="my_project",
+        usage_quota_name="my_quota",
+        persist_predictions=True,
+        minutely_usage_limit=10,
+        hourly_usage_limit=100,
+        daily_usage_limit=1000,
+        max_image_size=(128, 128),
+        compression_level=75,
+        registration_tags=["some"],
+        disable_sink=False,
+        fire_and_forget=True,
+        labeling_batch_prefix="my_batch",
+        labeling_batches_recreation_frequency="never",
+    )
+
+    # then
+    run_in_parallel_mock.assert_not_called()
+    assert (
+        background_tasks.tasks[0].func is run_in_parallel_mock
+    ), "Expected parallel execution to happen only within the background task"
+
+
+@mock.patch.object(v1, "execute_registration")
+def test_run_sink_when_registration_scheduled_in_background_tasks_executes_registration(
+    execute_registration_mock: MagicMock,
+) -> None:
+    # given
+    execute_registration_mock.return_value = (False, "STATUS OK")
+    background_tasks = BackgroundTasks()
+    cache = MemoryCache()
+    data_collector_block = RoboflowDatasetUploadBlockV1(
+        cache=cache,
+        api_key="my_api_key",
+        background_tasks=background_tasks,
+        thread_pool_executor=None,
+    )
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="parent"),
+        numpy_image=np.zeros((512, 256, 3), dtype=np.uint8),
+    )
+    indices = [(0,), (1,)]
+
+    # when
+    _ = data_collector_block.run(
+        images=Batch(content=[image, image], indices=indices),
+        predictions=None,
+        target_project="my_project",
+        usage_quota_name="my_quota",
+        persist_predictions=True,
+        minutely_usage_limit=10,
+        hourly_usage_limit=100,
+        daily_usage_limit=1000,
+        max_image_size=(128, 128),
+        compression_level=75,
+        registration_tags=["some"],
+        disable_sink=False,
+        fire_and_forget=True,
+        labeling_batch_prefix="my_batch",
+        labeling_batches_recreation_frequency="never",
+    )
+    for task in background_tasks.tasks:
+        task.func(*task.args, **task.kwargs)
+
+    # then
+    execute_registration_mock.assert_has_calls(
+        [
+            call(
+                image=image,
+                prediction=None,
+                target_project="my_project",
+                persist_predictions=True,
+                matching_strategies_limits=build_matching_strategies_limits(
+                    usage_quota_name="my_quota",
+                    minutely_usage_limit=10,
+                    hourly_usage_limit=100,
+                    daily_usage_limit=1000,
+                ),
+                max_image_size=(128, 128),
+                compression_level=75,
+                registration_tags=["some"],
+                batch_name="my_batch",
+                cache=cache,
+                api_key="my_api_key",
+            )
+        ]
+        * 2
+    )
 
 
 @mock.patch.object(v1, "execute_registration", MagicMock())
@@ -1093,16 +1404,17 @@ def test_run_sink_when_registration_should_happen_in_foreground_despite_providin
                 image=image,
                 prediction=prediction,
                 target_project="my_project",
-                usage_quota_name="my_quota",
                 persist_predictions=True,
-                minutely_usage_limit=10,
-                hourly_usage_limit=100,
-                daily_usage_limit=1000,
+                matching_strategies_limits=build_matching_strategies_limits(
+                    usage_quota_name="my_quota",
+                    minutely_usage_limit=10,
+                    hourly_usage_limit=100,
+                    daily_usage_limit=1000,
+                ),
                 max_image_size=(128, 128),
                 compression_level=75,
                 registration_tags=["some"],
-                labeling_batch_prefix="my_batch",
-                new_labeling_batch_frequency="never",
+                batch_name="my_batch",
                 cache=cache,
                 api_key="my_api_key",
             )
@@ -1168,16 +1480,17 @@ def test_run_sink_when_predictions_not_provided(
                 image=image,
                 prediction=None,
                 target_project="my_project",
-                usage_quota_name="my_quota",
                 persist_predictions=True,
-                minutely_usage_limit=10,
-                hourly_usage_limit=100,
-                daily_usage_limit=1000,
+                matching_strategies_limits=build_matching_strategies_limits(
+                    usage_quota_name="my_quota",
+                    minutely_usage_limit=10,
+                    hourly_usage_limit=100,
+                    daily_usage_limit=1000,
+                ),
                 max_image_size=(128, 128),
                 compression_level=75,
                 registration_tags=["some"],
-                labeling_batch_prefix="my_batch",
-                new_labeling_batch_frequency="never",
+                batch_name="my_batch",
                 cache=cache,
                 api_key="my_api_key",
             )
@@ -9,6 +9,9 @@ from pydantic import ValidationError
 
 from inference.core.cache import MemoryCache
 from inference.core.workflows.core_steps.sinks.roboflow.dataset_upload import v2
+from inference.core.workflows.core_steps.sinks.roboflow.dataset_upload.v1 import (
+    build_matching_strategies_limits,
+)
 from inference.core.workflows.core_steps.sinks.roboflow.dataset_upload.v2 import (
     BlockManifest,
     RoboflowDatasetUploadBlockV2,
@@ -35,18 +38,19 @@ def test_maybe_register_datapoint_at_roboflow_when_data_sampled_off(
         image=MagicMock(),
         prediction=MagicMock(),
         target_project="some",
-        usage_quota_name="some",
         data_percentage=36.0,
         persist_predictions=True,
-        minutely_usage_limit=10,
-        hourly_usage_limit=100,
-        daily_usage_limit=1000,
+        matching_strategies_limits=build_matching_strategies_limits(
+            usage_quota_name="some",
+            minutely_usage_limit=10,
+            hourly_usage_limit=100,
+            daily_usage_limit=1000,
+        ),
         max_image_size=(128, 128),
         compression_level=75,
         registration_tags=[],
         fire_and_forget=False,
-        labeling_batch_prefix="some",
-        new_labeling_batch_frequency="never",
+        batch_name="some",
         cache=MagicMock(),
         background_tasks=MagicMock(),
         thread_pool_executor=MagicMock(),
@@ -73,18 +77,19 @@ def test_maybe_register_datapoint_at_roboflow_when_data_sample_accepted(
         image=MagicMock(),
         prediction=MagicMock(),
         target_project="some",
-        usage_quota_name="some",
         data_percentage=40.0,
         persist_predictions=True,
-        minutely_usage_limit=10,
-        hourly_usage_limit=100,
-        daily_usage_limit=1000,
+        matching_strategies_limits=build_matching_strategies_limits(
+            usage_quota_name="some",
+            minutely_usage_limit=10,
+            hourly_usage_limit=100,
+            daily_usage_limit=1000,
+        ),
         max_image_size=(128, 128),
         compression_level=75,
         registration_tags=[],
         fire_and_forget=False,
-        labeling_batch_prefix="some",
-        new_labeling_batch_frequency="never",
+        batch_name="some",
         cache=MagicMock(),
         background_tasks=MagicMock(),
         thread_pool_executor=MagicMock(),
@@ -18,7 +18,7 @@ from inference.core.workflows.core_steps.sinks.roboflow.custom_metadata.v1 impor
 def test_get_workspace_name_when_cache_contains_workspace_name() -> None:
     # given
     api_key = "my_api_key"
-    api_key_hash = hashlib.md5(api_key.encode("utf-8")).hexdigest()
+    api_key_hash = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
     expected_cache_key = f"workflows:api_key_to_workspace:{api_key_hash}"
     cache = MemoryCache()
     cache.set(key=expected_cache_key, value="my_workspace")
@@ -41,7 +41,7 @@ def test_get_workspace_name_when_cache_does_not_contain_workspace_name(
     # given
     api_key = "my_api_key"
     cache = MemoryCache()
-    api_key_hash = hashlib.md5(api_key.encode("utf-8")).hexdigest()
+    api_key_hash = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
     expected_cache_key = f"workflows:api_key_to_workspace:{api_key_hash}"
     get_roboflow_workspace_mock.return_value = "workspace_from_api"
 
@@ -67,7 +67,7 @@ def test_add_custom_metadata_request_success(
     add_custom_metadata_mock.return_value = True
     cache = MemoryCache()
     api_key = "my_api_key"
-    api_key_hash = hashlib.md5(api_key.encode("utf-8")).hexdigest()
+    api_key_hash = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
     expected_cache_key = f"workflows:api_key_to_workspace:{api_key_hash}"
     cache.set(key=expected_cache_key, value="my_workspace")
     inference_ids = np.array(["id1", "id2"])
@@ -103,7 +103,7 @@ def test_add_custom_metadata_request_failure(
     add_custom_metadata_mock.side_effect = Exception("API error")
     cache = MemoryCache()
     api_key = "my_api_key"
-    api_key_hash = hashlib.md5(api_key.encode("utf-8")).hexdigest()
+    api_key_hash = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
     expected_cache_key = f"workflows:api_key_to_workspace:{api_key_hash}"
     cache.set(key=expected_cache_key, value="my_workspace")
     inference_ids = ["id1", "id2"]
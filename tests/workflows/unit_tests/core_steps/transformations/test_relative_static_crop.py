@@ -46,9 +46,9 @@ def test_take_relative_static_crop() -> None:
     )
 
     # then
-    assert (
-        result.numpy_image == (np.ones((20, 10, 3), dtype=np.uint8) * 30)
-    ).all(), "Crop must have the exact size and color"
+    assert np.array_equal(
+        result.numpy_image, np.full((20, 10, 3), 30, dtype=np.uint8)
+    ), "Crop must have the exact size and color"
     assert result.parent_metadata.parent_id.startswith(
         "relative_static_crop."
     ), "Parent must be set at crop step identifier"
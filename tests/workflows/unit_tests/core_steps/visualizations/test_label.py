@@ -4,6 +4,7 @@ import supervision as sv
 from pydantic import ValidationError
 
 from inference.core.workflows.core_steps.visualizations.label.v1 import (
+    TEXT_TO_LABELS_GENERATOR,
     LabelManifest,
     LabelVisualizationBlockV1,
 )
@@ -115,3 +116,30 @@ def test_label_visualization_block() -> None:
     assert not np.array_equal(
         output.get("image").numpy_image, np.zeros((1000, 1000, 3), dtype=np.uint8)
     )
+
+
+@pytest.mark.parametrize(
+    "text, expected_labels",
+    [
+        ("Confidence", ["0.50", "0.90"]),
+        ("Class and Confidence", ["cat 0.50", "dog 0.90"]),
+        ("Index", ["0", "1"]),
+        ("Dimensions", ["10, 10 20x20", "100, 100 40x40"]),
+        ("Area", ["400", "1600"]),
+        ("Time In Zone", ["In zone: N/A", "In zone: N/A"]),
+    ],
+)
+def test_labels_generation(text: str, expected_labels: list) -> None:
+    # given
+    predictions = sv.Detections(
+        xyxy=np.array([[0, 0, 20, 20], [80, 80, 120, 120]], dtype=np.float64),
+        class_id=np.array([1, 2]),
+        confidence=np.array([0.5, 0.9]),
+        data={"class_name": np.array(["cat", "dog"])},
+    )
+
+    # when
+    result = TEXT_TO_LABELS_GENERATOR[text](predictions)
+
+    # then
+    assert list(result) == expected_labels
@@ -357,7 +357,7 @@ def test_is_selector_when_selector_given(selector: str) -> None:
     assert result is True
 
 
-@pytest.mark.parametrize("value", ["some", 1, [1, 2, 3]])
+@pytest.mark.parametrize("value", ["some", 1, [1, 2, 3], ["$inputs.a"], None])
 def test_is_selector_when_not_a_selector_given(value: Any) -> None:
     # when
     result = is_selector(selector_or_value=value)
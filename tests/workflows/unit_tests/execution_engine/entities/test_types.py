@@ -0,0 +1,67 @@
+from typing import List, Literal
+
+from inference.core.workflows.execution_engine.entities.base import OutputDefinition
+from inference.core.workflows.execution_engine.entities.types import (
+    STRING_KIND,
+    StepOutputSelector,
+    WorkflowParameterSelector,
+)
+from inference.core.workflows.prototypes.block import WorkflowBlockManifest
+
+
+class FirstManifest(WorkflowBlockManifest):
+    type: Literal["FirstBlock"]
+    step_output: StepOutputSelector(kind=[STRING_KIND])
+    parameter: WorkflowParameterSelector(kind=[STRING_KIND])
+
+    @classmethod
+    def describe_outputs(cls) -> List[OutputDefinition]:
+        return []
+
+
+class SecondManifest(WorkflowBlockManifest):
+    type: Literal["SecondBlock"]
+    step_output: StepOutputSelector(kind=[STRING_KIND])
+    parameter: WorkflowParameterSelector(kind=[STRING_KIND])
+
+    @classmethod
+    def describe_outputs(cls) -> List[OutputDefinition]:
+        return []
+
+
+def test_selectors_schema_when_schema_of_another_manifest_is_mutated() -> None:
+    # given
+    first_schema = FirstManifest.model_json_schema()
+
+    # when
+    for property_name in ["step_output", "parameter"]:
+        property_schema = first_schema["properties"][property_name]
+        property_schema["kind"].append({"name": "injected"})
+        property_schema["reference"] = False
+    second_schema = SecondManifest.model_json_schema()
+    first_schema_generated_again = FirstManifest.model_json_schema()
+
+    # then
+    for schema in [second_schema, first_schema_generated_again]:
+        for property_name in ["step_output", "parameter"]:
+            property_schema = schema["properties"][property_name]
+            assert property_schema["kind"] == [
+                STRING_KIND.dict()
+            ], "Expected kinds not to be affected by mutation of other schema"
+            assert (
+                property_schema["reference"] is True
+            ), "Expected selector metadata not to be affected by mutation of other schema"
+
+
+def test_selectors_schema_metadata_is_not_shared_as_mutable_dict() -> None:
+    # when
+    first_fields = FirstManifest.model_fields
+    second_fields = SecondManifest.model_fields
+
+    # then
+    for property_name in ["step_output", "parameter"]:
+        first_extra = first_fields[property_name].json_schema_extra
+        second_extra = second_fields[property_name].json_schema_extra
+        assert not isinstance(first_extra, dict) or (
+            first_extra is not second_extra
+        ), "Expected no mutable schema metadata to be shared between manifests"
@@ -1,3 +1,5 @@
+import gc
+import weakref
 from typing import Dict, List, Literal, Optional, Set, Union
 
 from pydantic import BaseModel, Field
@@ -509,3 +511,50 @@ def test_parse_block_manifest_when_manifest_defines_selector_inside_dictionary()
             )
         },
     )
+
+
+def test_parse_block_manifest_when_the_same_manifest_is_parsed_twice() -> None:
+    # given
+
+    class Manifest(WorkflowBlockManifest):
+        type: Literal["MyManifest"]
+        name: str = Field(description="name field")
+        image: WorkflowImageSelector
+
+        @classmethod
+        def describe_outputs(cls) -> List[OutputDefinition]:
+            return []
+
+    # when
+    first_result = parse_block_manifest(manifest_type=Manifest)
+    second_result = parse_block_manifest(manifest_type=Manifest)
+
+    # then
+    assert (
+        first_result is second_result
+    ), "Expected parsed manifest to be re-used rather than computed again"
+
+
+def test_parse_block_manifest_when_manifest_class_is_no_longer_referenced() -> None:
+    # given
+
+    class Manifest(WorkflowBlockManifest):
+        type: Literal["MyManifest"]
+        name: str = Field(description="name field")
+        image: WorkflowImageSelector
+
+        @classmethod
+        def describe_outputs(cls) -> List[OutputDefinition]:
+            return []
+
+    _ = parse_block_manifest(manifest_type=Manifest)
+    manifest_reference = weakref.ref(Manifest)
+
+    # when
+    del Manifest
+    gc.collect()
+
+    # then
+    assert (
+        manifest_reference() is None
+    ), "Expected parsed manifests cache not to keep manifest class alive"
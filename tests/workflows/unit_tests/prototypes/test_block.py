@@ -0,0 +1,75 @@
+from typing import List, Literal
+
+from inference.core.workflows.execution_engine.entities.base import OutputDefinition
+from inference.core.workflows.execution_engine.entities.types import (
+    IMAGE_KIND,
+    STRING_KIND,
+)
+from inference.core.workflows.prototypes.block import WorkflowBlockManifest
+
+
+def test_get_actual_outputs_when_called_multiple_times() -> None:
+    # given
+    describe_outputs_calls = []
+
+    class Manifest(WorkflowBlockManifest):
+        type: Literal["SomeBlock"]
+
+        @classmethod
+        def describe_outputs(cls) -> List[OutputDefinition]:
+            describe_outputs_calls.append(cls)
+            return [OutputDefinition(name="result", kind=[STRING_KIND])]
+
+    manifest = Manifest(type="SomeBlock", name="some")
+    other_manifest = Manifest(type="SomeBlock", name="other")
+
+    # when
+    first_result = manifest.get_actual_outputs()
+    first_result.append(OutputDefinition(name="injected"))
+    second_result = manifest.get_actual_outputs()
+    third_result = other_manifest.get_actual_outputs()
+
+    # then
+    assert (
+        second_result
+        == third_result
+        == [OutputDefinition(name="result", kind=[STRING_KIND])]
+    ), "Expected declared outputs not to be affected by mutation of previous result"
+    assert (
+        second_result is not third_result
+    ), "Expected separate list to be returned on each call"
+    assert describe_outputs_calls == [
+        Manifest
+    ], "Expected outputs to be described once per manifest class"
+
+
+def test_get_actual_outputs_when_subclass_overrides_outputs() -> None:
+    # given
+    class ParentManifest(WorkflowBlockManifest):
+        type: Literal["ParentBlock"]
+
+        @classmethod
+        def describe_outputs(cls) -> List[OutputDefinition]:
+            return [OutputDefinition(name="result", kind=[STRING_KIND])]
+
+    class ChildManifest(ParentManifest):
+        type: Literal["ChildBlock"]
+
+        @classmethod
+        def describe_outputs(cls) -> List[OutputDefinition]:
+            return [OutputDefinition(name="image", kind=[IMAGE_KIND])]
+
+    parent_manifest = ParentManifest(type="ParentBlock", name="some")
+    child_manifest = ChildManifest(type="ChildBlock", name="other")
+
+    # when
+    parent_result = parent_manifest.get_actual_outputs()
+    child_result = child_manifest.get_actual_outputs()
+
+    # then
+    assert parent_result == [
+        OutputDefinition(name="result", kind=[STRING_KIND])
+    ], "Expected parent outputs to be returned for parent manifest"
+    assert child_result == [
+        OutputDefinition(name="image", kind=[IMAGE_KIND])
+    ], "Expected outputs of subclass to be cached separately from parent outputs"